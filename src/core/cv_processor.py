@@ -1,4 +1,6 @@
 import pdfplumber
+import functools
+import random
 import re
 import os
 import sys
@@ -6,9 +8,14 @@ from typing import Dict, List, Optional, Any
 from datetime import datetime
 import shutil
 import pandas as pd
+from sqlalchemy import insert, select
 from database.models.applicant import ApplicantProfile, ApplicantDetail
 from database.models.database import SessionLocal
 
+# Written next to an imported resume CSV; a CSV older than its marker has
+# already been imported
+CSV_IMPORT_MARKER_SUFFIX = ".imported"
+
 
 class CVProcessor:
     """Process CV files and extract information with robust PDF handling"""
@@ -806,6 +813,32 @@ class CVProcessor:
                                     cv_path_for_db: Optional[str], txt_path_for_db: Optional[str],
                                     category: Optional[str] = None, applicant_id: Optional[int] = None) -> Optional[int]:
         """Common logic to process extracted text and save to DB using new schema."""
+        if applicant_id is None:
+            applicant_id = self._get_random_existing_applicant()
+        applicant_detail_data = self._build_detail_data(
+            extracted_text, source_reference, cv_path_for_db, txt_path_for_db, applicant_id)
+
+        db = SessionLocal()
+        try:
+            # Create ApplicantDetail record
+            applicant_detail = ApplicantDetail.from_dict(applicant_detail_data)
+            db.add(applicant_detail)
+            db.commit()
+            db.refresh(applicant_detail)
+
+            return applicant_detail.detail_id
+
+        except Exception as e:
+            print(f"ERROR: Failed to save CV to database: {e}")
+            db.rollback()
+            return None
+        finally:
+            db.close()
+
+    def _build_detail_data(self, extracted_text: str, source_reference: str,
+                           cv_path_for_db: Optional[str], txt_path_for_db: Optional[str],
+                           applicant_id: int) -> Dict[str, Any]:
+        """Build the ApplicantDetail column values for a processed resume"""
         # Extract applicant role from first line
         application_role = self.extract_application_role(extracted_text)
 
@@ -818,29 +851,37 @@ class CVProcessor:
                 # This is a last resort, should ideally not be hit if txt_file always saves
                 # If no applicant_id is provided, use a random existing applicant
                 final_cv_path_for_db = f"MISSING_FILE_PATH_FOR_{source_reference.replace('.', '_')}"
-        if applicant_id is None:
-            applicant_id = self._get_random_existing_applicant()
 
-        applicant_detail_data = {
+        return {
             'applicant_id': applicant_id,
             'application_role': application_role,
             'cv_path': final_cv_path_for_db
         }
 
+    def _get_existing_applicant_ids(self) -> List[int]:
+        """Get the IDs of all applicant profiles, creating the default profile if there are none"""
         db = SessionLocal()
         try:
-            # Create ApplicantDetail record
-            applicant_detail = ApplicantDetail.from_dict(applicant_detail_data)
-            db.add(applicant_detail)
-            db.commit()
-            db.refresh(applicant_detail)
-
-            return applicant_detail.detail_id
+            applicant_ids = list(db.scalars(
+                select(ApplicantProfile.applicant_id)))
+        except Exception as e:
+            print(f"Error getting applicant IDs: {e}")
+            applicant_ids = []
+        finally:
+            db.close()
+        return applicant_ids or [self._get_random_existing_applicant()]
 
+    def _save_detail_rows(self, detail_rows: List[Dict[str, Any]]) -> bool:
+        """Insert ApplicantDetail rows in a single executemany statement"""
+        db = SessionLocal()
+        try:
+            db.execute(insert(ApplicantDetail), detail_rows)
+            db.commit()
+            return True
         except Exception as e:
-            print(f"ERROR: Failed to save CV to database: {e}")
+            print(f"ERROR: Failed to save CVs to database: {e}")
             db.rollback()
-            return None
+            return False
         finally:
             db.close()
 
@@ -849,7 +890,6 @@ class CVProcessor:
         db = SessionLocal()
         try:
             # Get a random existing applicant from the database
-            import random
             applicants = db.query(ApplicantProfile).all()
 
             if applicants:
@@ -881,13 +921,38 @@ class CVProcessor:
         finally:
             db.close()
 
-    def process_csv_resumes(self, csv_file_path: str = "data/initial/resume.csv"):
+    def _csv_already_imported(self, csv_file_path: str, marker_path: str) -> bool:
+        """Check whether the CSV is unchanged since its last import and the resumes are still in the database"""
+        try:
+            if os.path.getmtime(csv_file_path) > os.path.getmtime(marker_path):
+                return False
+        except OSError:
+            # No CSV or no import marker yet
+            return False
+
+        db = SessionLocal()
+        try:
+            return db.scalar(select(ApplicantDetail.detail_id).limit(1)) is not None
+        except Exception as e:
+            print(f"Error checking for imported resumes: {e}")
+            return False
+        finally:
+            db.close()
+
+    def process_csv_resumes(self, csv_file_path: str = "data/initial/resume.csv", force: bool = False):
         """
         Reads resumes from a CSV file, selects up to 20 from each category,
         and processes them with progress tracking.
         The CSV should have 'ID', 'Resume_str', 'Category' columns.
         'Resume_html' is ignored.
+        Skipped when the CSV has not changed since it was last imported,
+        unless force is set.
         """
+        marker_path = csv_file_path + CSV_IMPORT_MARKER_SUFFIX
+        if not force and self._csv_already_imported(csv_file_path, marker_path):
+            print(f"Resumes from {csv_file_path} are already imported, skipping")
+            return
+
         print(f"\n=== Starting CSV processing from: {csv_file_path} ===")
         start_time = datetime.now()
 
@@ -931,6 +996,10 @@ class CVProcessor:
 
         processed_count = 0
         failed_to_save_db_count = 0
+        # Rows are inserted together once every resume has been read, and
+        # each is assigned to a random existing applicant
+        applicant_ids = self._get_existing_applicant_ids()
+        detail_rows = []
 
         for index, row in selected_resumes_df.iterrows():
             resume_id = str(row['ID']).strip()
@@ -945,7 +1014,7 @@ class CVProcessor:
                 continue
 
             # Show progress
-            progress = processed_count + failed_to_save_db_count + 1
+            progress = len(detail_rows) + failed_to_save_db_count + 1
             if self.show_progress:
                 print(
                     f"[{progress}/{total_resumes}] Processing {category}/{resume_id}...", end='')
@@ -963,19 +1032,29 @@ class CVProcessor:
                 failed_to_save_db_count += 1
                 continue
 
-            # Process and save to database
-            db_id = self._process_common_resume_text(cleaned_text, source_reference_filename,
-                                                     cv_path_for_db=None,  # Explicitly None for CSV
-                                                     txt_path_for_db=txt_filepath,
-                                                     category=category)
-            if db_id is not None:
-                processed_count += 1
-                if self.show_progress:
-                    print(" ✓")
-            else:
-                failed_to_save_db_count += 1
-                if self.show_progress:
-                    print(" ✗ (failed to save to database)")
+            # Queue for the database
+            detail_rows.append(self._build_detail_data(
+                cleaned_text, source_reference_filename,
+                cv_path_for_db=None,  # Explicitly None for CSV
+                txt_path_for_db=txt_filepath,
+                applicant_id=random.choice(applicant_ids)))
+            if self.show_progress:
+                print(" queued")
+
+        # Rows only count as saved once the batch insert has committed
+        if detail_rows and not self._save_detail_rows(detail_rows):
+            failed_to_save_db_count += len(detail_rows)
+        elif detail_rows:
+            processed_count = len(detail_rows)
+            if self.show_progress:
+                print(f"✓ Saved {processed_count} resumes to the database")
+            # Remember the import so the next run can skip it; without the
+            # marker the next run simply imports again
+            try:
+                with open(marker_path, 'w', encoding='utf-8') as marker:
+                    marker.write(datetime.now().isoformat())
+            except OSError as e:
+                print(f"Warning: could not write import marker {marker_path}: {e}")
 
         # Show completion statistics
         end_time = datetime.now()
@@ -1149,3 +1228,9 @@ class CVProcessor:
                 'education': [],
                 'application_role': ''
             }
+
+
+@functools.cache
+def get_cv_processor() -> CVProcessor:
+    """Get the process-wide CVProcessor, creating it on first use"""
+    return CVProcessor()
@@ -21,7 +21,7 @@ from core.search_workers import (
     _process_chunk_fuzzy_dynamic,
     _process_applicant_chunk
 )
-from core.cv_processor import CVProcessor
+from core.cv_processor import CVProcessor, get_cv_processor
 from algorithms.fuzzy_matcher import FuzzyMatcher
 from algorithms.aho_corasick import AhoCorasickMatcher
 from algorithms.boyer_moore import BoyerMooreMatcher
@@ -30,6 +30,8 @@ from database.models.database import SessionLocal
 import time
 import multiprocessing
 import sys
+import threading
+from collections import OrderedDict
 from concurrent.futures import ProcessPoolExecutor, as_completed
 from typing import List, Dict, Optional, Any
 
@@ -44,6 +46,10 @@ if __name__ != '__main__':
             pass
 
 
+# Number of processed applicant details kept for reopening the detail page
+DETAILS_CACHE_SIZE = 32
+
+
 def _test_multiprocessing_worker():
     """Simple test function for multiprocessing - must be at module level"""
     return True
@@ -102,8 +108,15 @@ class SearchEngine:
         self.boyer_moore_matcher: BoyerMooreMatcher = BoyerMooreMatcher()
         self.aho_corasick_matcher: AhoCorasickMatcher = AhoCorasickMatcher()
         self.fuzzy_matcher: FuzzyMatcher = FuzzyMatcher()
-        # Initialize CV processor for computing fields on demand
-        self.cv_processor: CVProcessor = CVProcessor()
+        # Processed details by detail_id, least recently used first
+        self._details_cache: "OrderedDict[int, Dict]" = OrderedDict()
+        # The detail page reads and fills the cache from background threads
+        self._details_cache_lock = threading.Lock()
+
+    @property
+    def cv_processor(self) -> CVProcessor:
+        """CV processor for computing fields on demand, shared across the app"""
+        return get_cv_processor()
 
     def search(self, keywords: List[str], algorithm: str = "KMP",
                max_results: int = 10, fuzzy_threshold: float = None,
@@ -799,8 +812,39 @@ class SearchEngine:
             'error': error
         }
 
-    def get_applicant_details(self, detail_id: int) -> Optional[Dict]:
-        """Get detailed applicant information with computed CV fields by detail_id"""
+    def get_applicant_details(self, detail_id: int, detail: Optional[ApplicantDetail] = None) -> Optional[Dict]:
+        """Get detailed applicant information with computed CV fields by detail_id
+
+        Pass an already loaded detail (with its profile) to skip the database query.
+        Results are cached, so reopening a detail does not re-read its CV.
+        """
+        with self._details_cache_lock:
+            cached = self._details_cache.get(detail_id)
+            if cached is not None:
+                self._details_cache.move_to_end(detail_id)
+                return cached
+
+        if detail is None:
+            detail = self._load_applicant_detail(detail_id)
+            if detail is None:
+                return None
+
+        try:
+            detail_dict = self._process_single_applicant(detail)
+        except Exception as e:
+            print(
+                f"Error getting applicant details for detail_id {detail_id}: {e}")
+            return None
+
+        with self._details_cache_lock:
+            self._details_cache[detail_id] = detail_dict
+            self._details_cache.move_to_end(detail_id)
+            while len(self._details_cache) > DETAILS_CACHE_SIZE:
+                self._details_cache.popitem(last=False)
+        return detail_dict
+
+    def _load_applicant_detail(self, detail_id: int) -> Optional[ApplicantDetail]:
+        """Load an applicant detail together with its profile"""
         db = SessionLocal()
         try:
             from sqlalchemy.orm import joinedload
@@ -812,12 +856,7 @@ class SearchEngine:
 
             if not applicant_detail:
                 print(f"No applicant found with detail_id: {detail_id}")
-                return None
-
-            # Convert to dictionary and process
-            detail_dict = self._process_single_applicant(applicant_detail)
-
-            return detail_dict
+            return applicant_detail
 
         except Exception as e:
             print(
@@ -8,7 +8,7 @@ from algorithms.kmp import KMPMatcher
 from algorithms.boyer_moore import BoyerMooreMatcher
 from algorithms.aho_corasick import AhoCorasickMatcher
 from algorithms.fuzzy_matcher import FuzzyMatcher
-from core.cv_processor import CVProcessor
+from core.cv_processor import CVProcessor, get_cv_processor
 from utils.type_safety import (
     safe_get_str,
     safe_get_list,
@@ -33,7 +33,7 @@ def _process_chunk_exact(applicant_chunk: List[Dict], keywords: List[str], algor
         else:
             matcher = KMPMatcher()  # Default
 
-        cv_processor = CVProcessor()
+        cv_processor = get_cv_processor()
 
         # Process Aho-Corasick differently (multi-pattern search)
         if algorithm == "AC":
@@ -193,7 +193,7 @@ def _process_chunk_fuzzy_dynamic(applicant_chunk: List[Dict], keywords: List[str
 
     try:
         fuzzy_matcher = FuzzyMatcher()
-        cv_processor = CVProcessor()
+        cv_processor = get_cv_processor()
 
         for applicant in applicant_chunk:
             applicant_id = safe_get_int(applicant, 'detail_id', 0)
@@ -296,7 +296,7 @@ def _process_chunk_fuzzy_dynamic(applicant_chunk: List[Dict], keywords: List[str
 def _process_applicant_chunk(applicant_chunk: List[Dict]) -> List[Dict]:
     """Worker function for parallel applicant processing"""
     try:
-        cv_processor = CVProcessor()
+        cv_processor = get_cv_processor()
         results = []
 
         for detail_dict in applicant_chunk:
@@ -56,6 +56,18 @@ class ApplicantProfile(Base):
         """Get data ready for display (decrypted if needed)"""
         return self.decrypt_data() if self.is_encrypted else self
 
+    @property
+    def full_name(self) -> str:
+        """Decrypted first and last name, decrypted once per instance"""
+        # Loaded instances skip __init__, so the cache attribute may be missing
+        full_name = getattr(self, "_full_name", None)
+        if full_name is None:
+            decrypt = encryption.decrypt if self.is_encrypted else str
+            full_name = " ".join(
+                filter(None, (decrypt(self.first_name or ""), decrypt(self.last_name or ""))))
+            self._full_name = full_name
+        return full_name
+
     def to_dict(self) -> Dict:
         """
         Convert model instance to dictionary.
@@ -12,7 +12,10 @@ DATABASE_PORT = os.getenv("DB_PORT", "3306")
 # Construct database URL
 DATABASE_URL = f"mysql+pymysql://{DATABASE_USER}:{DATABASE_PASSWORD}@{DATABASE_HOST}:{DATABASE_PORT}/{DATABASE_NAME}"
 
-engine = create_engine(DATABASE_URL, echo=False)
+# Connections are pooled and reused across sessions; pre-ping replaces
+# connections MySQL has closed while idle
+engine = create_engine(DATABASE_URL, echo=False,
+                       pool_size=5, pool_pre_ping=True)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
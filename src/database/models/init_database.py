@@ -3,6 +3,11 @@ from mysql.connector import Error
 from sqlalchemy import inspect, text
 from .database import Base, engine, DATABASE_HOST, DATABASE_USER, DATABASE_PASSWORD, DATABASE_NAME
 
+# Columns of every table in the application database, in table order
+_SCHEMA_COLUMNS_QUERY = text(
+    "SELECT TABLE_NAME, COLUMN_NAME, COLUMN_TYPE FROM information_schema.columns "
+    "WHERE TABLE_SCHEMA = :schema ORDER BY TABLE_NAME, ORDINAL_POSITION")
+
 
 def create_database_if_not_exists():
     """Create database if it doesn't exist"""
@@ -163,15 +168,18 @@ def init_db(force_recreate: bool = False):
 def get_schema_info():
     """Get current database schema information for debugging"""
     try:
-        inspector = inspect(engine)
-        schema_info = {}
+        # One query for every table's columns instead of a reflection
+        # round trip per table
+        with engine.connect() as conn:
+            rows = conn.execute(_SCHEMA_COLUMNS_QUERY, {
+                                "schema": DATABASE_NAME}).all()
 
-        for table_name in inspector.get_table_names():
-            columns = inspector.get_columns(table_name)
-            schema_info[table_name] = {
-                'columns': {col['name']: str(col['type']) for col in columns},
-                'column_count': len(columns)
-            }
+        schema_info = {}
+        for table_name, column_name, column_type in rows:
+            table_info = schema_info.setdefault(
+                table_name, {'columns': {}, 'column_count': 0})
+            table_info['columns'][column_name] = column_type
+            table_info['column_count'] += 1
 
         return schema_info
 
@@ -566,9 +566,9 @@ class DetailView:
             else:
                 # Create a temporary text file with computed content
                 import tempfile
-                from core.cv_processor import CVProcessor
+                from core.cv_processor import get_cv_processor
 
-                processor = CVProcessor()
+                processor = get_cv_processor()
                 computed_fields = processor.compute_cv_fields(cv_path)
                 extracted_text = safe_get_str(
                     computed_fields, 'extracted_text', '')
@@ -5,9 +5,8 @@ from typing import Callable
 class UploadSection:
     """CV upload section component"""
 
-    def __init__(self, page: ft.Page, cv_processor, on_upload_callback: Callable, get_applicant_id_func: Callable = None):
+    def __init__(self, page: ft.Page, on_upload_callback: Callable, get_applicant_id_func: Callable = None):
         self.page = page
-        self.cv_processor = cv_processor
         self.on_upload_callback = on_upload_callback
         # Function to get selected applicant ID
         self.get_applicant_id_func = get_applicant_id_func
@@ -112,8 +111,11 @@ class UploadSection:
             if self.get_applicant_id_func:
                 applicant_id = self.get_applicant_id_func()
 
+            # The processor is created on the first upload, not at startup
+            from core.cv_processor import get_cv_processor
+
             # Process the CV file
-            result_id = self.cv_processor.process_cv_file(
+            result_id = get_cv_processor().process_cv_file(
                 self.selected_file.path,
                 self.selected_file.name,
                 applicant_id=applicant_id
@@ -122,7 +124,8 @@ class UploadSection:
             if result_id:
                 # Success
                 self.on_upload_callback(
-                    True, f"CV uploaded successfully! Detail ID: {result_id}. Text extracted and saved.")
+                    True, f"CV uploaded successfully! Detail ID: {result_id}. Text extracted and saved.",
+                    {"detail_id": result_id})
                 self.reset_form()
             else:
                 # Failed
@@ -10,25 +10,24 @@ from database.models.applicant import ApplicantProfile
 class MainWindow:
     """Main window for CV matching application with multipage navigation and type safety"""
 
-    def __init__(self, page: ft.Page, session_factory: Callable, cv_processor: Any, search_engine: Any):
+    def __init__(self, page: ft.Page, session_factory: Callable, search_engine: Any):
         self.page: ft.Page = page
         self.session_factory: Callable = session_factory
-        self.cv_processor: Any = cv_processor
         self.search_engine: Any = search_engine
 
         # Initialize page classes
         try:
             self.applicants_page: ApplicantsPage = ApplicantsPage(
-                self.page, self.session_factory, self.cv_processor, self._view_applicant_detail
+                self.page, self.session_factory, self._view_applicant_detail
             )
             self.applications_page: ApplicationsPage = ApplicationsPage(
-                self.page, self.session_factory, self.cv_processor, self._view_application_detail
+                self.page, self.session_factory, self._view_application_detail
             )
             self.search_page: SearchPage = SearchPage(
                 self.page, self.search_engine, self.on_result_selected
             )
             self.detail_page: DetailPage = DetailPage(
-                self.page, self.session_factory, self.on_back_to_results
+                self.page, self.session_factory, self.on_back_to_results, self.search_engine
             )
 
             # Set upload callback for applications page
@@ -190,12 +189,11 @@ class MainWindow:
     def on_cv_uploaded(self, success: bool, message: str):
         """Handle CV upload completion"""
         if success:
+            # The applications page updates its own list, no full rebuild needed
             self.page.snack_bar = ft.SnackBar(
                 content=ft.Text(f"Success: {message}"),
                 bgcolor=ft.Colors.GREEN_100
             )
-            # Refresh current page content
-            self._update_content()
         else:
             self.page.snack_bar = ft.SnackBar(
                 content=ft.Text(f"Error: {message}"),
@@ -203,7 +201,6 @@ class MainWindow:
             )
         self.page.snack_bar.open = True
         self.page.update()
-        self.page.update()
 
     def on_search_performed(self, results: Dict):
         """Handle search completion - delegated to search page"""
@@ -230,9 +227,7 @@ class MainWindow:
             if hasattr(self.applications_page, '_refresh_applicant_dropdown'):
                 self.applications_page._refresh_applicant_dropdown()
 
-            # Refresh current page content
-            self._update_content()
-
+            # The applicants page updates its own list, no full rebuild needed
             self.page.snack_bar = ft.SnackBar(
                 content=ft.Text(f"Success: {message}"),
                 bgcolor=ft.Colors.GREEN_100
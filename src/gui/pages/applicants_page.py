@@ -1,24 +1,74 @@
 import flet as ft
-from typing import Callable
+import logging
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Optional, Tuple
+from sqlalchemy import func, select
+from sqlalchemy.exc import SQLAlchemyError
 from database.models.applicant import ApplicantProfile
+from utils.encryption import encryption
 from datetime import datetime
 
+# Maximum number of address characters rendered on an applicant card
+ADDRESS_PREVIEW_LENGTH = 200
+# Cards rendered per update when a freshly loaded page is shown
+CARD_RENDER_CHUNK = 10
+# Applicant cards and loaded pages kept around for reuse
+CARD_CACHE_SIZE = 200
+LIST_CACHE_SIZE = 5
+
+logger = logging.getLogger(__name__)
+
+# Shared text styles for applicant cards
+_CARD_TITLE_STYLE = dict(size=16, weight=ft.FontWeight.BOLD)
+_CARD_DETAIL_STYLE = dict(size=14, color=ft.Colors.GREY_600)
+_CARD_META_STYLE = dict(size=12, color=ft.Colors.GREY_500)
+_CARD_ADDRESS_STYLE = dict(size=12, color=ft.Colors.GREY_600, max_lines=2,
+                           overflow=ft.TextOverflow.ELLIPSIS)
+
+# Statements are built once so SQLAlchemy's compiled cache is hit on every
+# refresh. Names are stored encrypted with a random salt, so sorting on them
+# neither reflects the real names nor can use an index; the primary key gives
+# a stable order served straight from its index.
+_APPLICANTS_PAGE_STMT = select(
+    ApplicantProfile.applicant_id,
+    ApplicantProfile.first_name,
+    ApplicantProfile.last_name,
+    ApplicantProfile.date_of_birth,
+    ApplicantProfile.address,
+    ApplicantProfile.phone_number,
+    ApplicantProfile.is_encrypted,
+).order_by(ApplicantProfile.applicant_id)
+_APPLICANTS_COUNT_STMT = select(func.count(ApplicantProfile.applicant_id))
+_APPLICANTS_EXIST_STMT = select(select(ApplicantProfile.applicant_id).exists())
+
 
 class ApplicantsPage:
     """Applicants management page for creating and managing applicant profiles"""
 
-    def __init__(self, page: ft.Page, session_factory, cv_processor, on_view_detail: Callable):
+    def __init__(self, page: ft.Page, session_factory, on_view_detail: Callable):
         self.page = page
         self.session_factory = session_factory
-        self.cv_processor = cv_processor
         self.on_view_detail = on_view_detail
 
-        # Pagination state
-        self.current_page = 1
-        self.items_per_page = 10
+        # Pagination state, restored from the previous session so the first
+        # query already uses the preferred page size
+        self.current_page = self._load_pagination_preference(
+            "applicants.last_page", 1)
+        self.items_per_page = self._load_pagination_preference(
+            "applicants.page_size", 10)
+        # Last (page size, page) written to client storage
+        self._saved_preferences = (self.items_per_page, self.current_page)
         self.total_applicants = 0
         self.total_pages = 0
 
+        # Applicant cards keyed by applicant ID, and loaded pages keyed by
+        # (page, items per page), least recently used first; both are used
+        # from the loading threads too
+        self._card_cache: OrderedDict = OrderedDict()
+        self._list_cache: OrderedDict = OrderedDict()
+        self._cache_lock = threading.Lock()
+
         # Form fields
         self.first_name_field = ft.TextField(label="First Name", width=300)
         self.last_name_field = ft.TextField(label="Last Name", width=300)
@@ -27,6 +77,8 @@ class ApplicantsPage:
             last_date=datetime.now(),
             on_change=self._on_date_selected
         )
+        # Date picked in date_of_birth_field, set by _on_date_selected
+        self._parsed_dob = None
         self.date_display_field = ft.TextField(
             label="Date of Birth",
             width=300,
@@ -44,15 +96,30 @@ class ApplicantsPage:
             max_lines=4
         )
         self.phone_number_field = ft.TextField(label="Phone Number", width=300)
+        self.snack_bar = ft.SnackBar(content=ft.Text(""))
         self.on_applicant_created_callback = None
 
         # UI component references for dynamic updates
         self.applicants_list_container = None
+        self.applicants_list_view = None
+        self.applicants_total_text = None
+        self.create_button = None
         self.pagination_info = None
         self.prev_button = None
         self.next_button = None
         self.page_input = None
 
+        # Static controls, built on first use and reused on every rebuild
+        self._header = None
+        self._create_form = None
+        self._empty_states: Dict[bool, ft.Control] = {}
+        self._error_view = None
+        self._error_text = None
+        self._loading_state = None
+
+        # Incremented per background page load so stale results are dropped
+        self._list_request_id = 0
+
     def set_applicant_created_callback(self, callback: Callable):
         """Set callback for when applicant is created"""
         self.on_applicant_created_callback = callback
@@ -81,7 +148,6 @@ class ApplicantsPage:
 
         # Create the applicants list container
         self.applicants_list_container = ft.Container(
-            content=self._build_applicants_list(),
             expand=True,
             padding=20,
             border=ft.border.all(1, ft.Colors.GREY_300),
@@ -89,19 +155,11 @@ class ApplicantsPage:
             margin=ft.Margin(20, 0, 0, 0),
             height=600
         )
+        self._load_applicants_list()
 
         return ft.Column([
             # Header
-            ft.Container(
-                content=ft.Row([
-                    ft.Text("Applicant Management", size=24,
-                            weight=ft.FontWeight.BOLD),
-                ], alignment=ft.MainAxisAlignment.START),
-                padding=10,
-                bgcolor=ft.Colors.WHITE,
-                border=ft.border.only(
-                    bottom=ft.BorderSide(1, ft.Colors.GREY_300))
-            ),
+            self._build_header(),
 
             # Content
             ft.Container(
@@ -129,9 +187,37 @@ class ApplicantsPage:
             )
         ], expand=True, scroll=ft.ScrollMode.AUTO)
 
+    def _build_header(self) -> ft.Control:
+        """Build the page header (static, so it is created once and reused)"""
+        if self._header is None:
+            self._header = ft.Container(
+                content=ft.Row([
+                    ft.Text("Applicant Management", size=24,
+                            weight=ft.FontWeight.BOLD),
+                ], alignment=ft.MainAxisAlignment.START),
+                padding=10,
+                bgcolor=ft.Colors.WHITE,
+                border=ft.border.only(
+                    bottom=ft.BorderSide(1, ft.Colors.GREY_300))
+            )
+        return self._header
+
     def _build_create_applicant_form(self) -> ft.Control:
-        """Build the create applicant form"""
-        return ft.Column([
+        """Build the create applicant form (created once and reused)"""
+        if self._create_form is not None:
+            return self._create_form
+
+        self.create_button = ft.ElevatedButton(
+            "Create Applicant",
+            icon=ft.Icons.PERSON_ADD,
+            on_click=self._on_create_applicant,
+            style=ft.ButtonStyle(
+                bgcolor=ft.Colors.BLUE_600,
+                color=ft.Colors.WHITE
+            )
+        )
+
+        self._create_form = ft.Column([
             ft.Text("Create New Applicant", size=18,
                     weight=ft.FontWeight.BOLD),
             ft.Divider(),            self.first_name_field,
@@ -143,15 +229,7 @@ class ApplicantsPage:
             ft.Container(height=20),  # Spacing
 
             ft.Row([
-                ft.ElevatedButton(
-                    "Create Applicant",
-                    icon=ft.Icons.PERSON_ADD,
-                    on_click=self._on_create_applicant,
-                    style=ft.ButtonStyle(
-                        bgcolor=ft.Colors.BLUE_600,
-                        color=ft.Colors.WHITE
-                    )
-                ),
+                self.create_button,
                 ft.TextButton(
                     "Clear Form",
                     on_click=self._on_clear_form
@@ -159,120 +237,280 @@ class ApplicantsPage:
             ], spacing=10),
 
         ], spacing=15)
+        return self._create_form
+
+    def _load_applicants_list(self):
+        """Fill the list container, querying the database in a separate thread on a cache miss"""
+        # Newer requests (e.g. quick page flips) supersede this one
+        self._list_request_id += 1
+        request_id = self._list_request_id
+
+        key = (self.current_page, self.items_per_page)
+        loaded = self._cached_list_page(key)
+        if loaded:
+            self.applicants_list_container.content = self._build_applicants_list(
+                loaded)
+            return
+
+        self.applicants_list_view = None
+        self.applicants_total_text = None
+        self.applicants_list_container.content = self._build_loading_state()
+
+        def load():
+            loaded = None
+            try:
+                loaded = self._fetch_applicants_page(*key)
+            except SQLAlchemyError as e:
+                if request_id != self._list_request_id:
+                    return
+                content = self._build_error_view(str(e))
+            else:
+                if request_id != self._list_request_id:
+                    return
+                try:
+                    # Show the first cards right away and decrypt the rest
+                    # in chunks after the list is on screen
+                    content = self._build_loaded_list(
+                        key, loaded, CARD_RENDER_CHUNK)
+                except Exception as e:
+                    # Not a database error; keep the traceback and still
+                    # replace the loading spinner
+                    logger.exception("Error rendering applicants list")
+                    self.applicants_list_view = None
+                    self.applicants_total_text = None
+                    content = self._build_error_view(str(e))
+
+            self.applicants_list_container.content = content
+            self.page.update()
 
-    def _build_applicants_list(self) -> ft.Control:
-        """Build the list of applicants with pagination"""
-        try:
-            db = self.session_factory()
+            list_view = self.applicants_list_view
+            rows = loaded[2][CARD_RENDER_CHUNK:] if list_view else []
             try:
-                # Get total count for pagination
-                self.total_applicants = db.query(ApplicantProfile).count()
-                self.total_pages = max(
-                    1, (self.total_applicants + self.items_per_page - 1) // self.items_per_page)
-
-                # Ensure current page is within bounds
-                self.current_page = max(
-                    1, min(self.current_page, self.total_pages))
-
-                # Calculate offset for pagination
-                offset = (self.current_page - 1) * self.items_per_page
-
-                # Get paginated applicants
-                applicants = db.query(ApplicantProfile).order_by(
-                    ApplicantProfile.first_name, ApplicantProfile.last_name).offset(offset).limit(self.items_per_page).all()
-
-                # Update pagination info
-                self._update_pagination_controls()
-
-                if not applicants:
-                    if self.total_applicants == 0:
-                        return ft.Container(
-                            content=ft.Column([
-                                ft.Icon(ft.Icons.PEOPLE_OUTLINE, size=64,
-                                        color=ft.Colors.GREY_400),
-                                ft.Text("No applicants found", size=16,
-                                        color=ft.Colors.GREY_600),
-                                ft.Text("Create a new applicant to get started",
-                                        size=14, color=ft.Colors.GREY_500),
-                            ], horizontal_alignment=ft.CrossAxisAlignment.CENTER),
-                            alignment=ft.alignment.center,
-                            expand=True
-                        )
-                    else:
-                        return ft.Container(
-                            content=ft.Column([
-                                ft.Icon(ft.Icons.PEOPLE_OUTLINE, size=64,
-                                        color=ft.Colors.GREY_400),
-                                ft.Text("No applicants on this page", size=16,
-                                        color=ft.Colors.GREY_600),
-                            ], horizontal_alignment=ft.CrossAxisAlignment.CENTER),
-                            alignment=ft.alignment.center,
-                            expand=True
-                        )
-
-                return ft.Column([
-                    ft.Row([
-                        ft.Text("Applicants", size=18,
-                                weight=ft.FontWeight.BOLD),
-                        ft.Container(expand=True),
-                        ft.Text(f"Total: {self.total_applicants}",
-                                size=14, color=ft.Colors.GREY_600)
-                    ]),
-                    ft.Divider(),
-                    ft.Container(
-                        content=ft.Column([
-                            self._create_applicant_card(applicant) for applicant in applicants
-                        ], spacing=10, scroll=ft.ScrollMode.AUTO),
-                        expand=True
-                    )
-                ], spacing=10, expand=True)
-
-            finally:
-                db.close()
-        except Exception as e:
-            return ft.Container(
+                for start in range(0, len(rows), CARD_RENDER_CHUNK):
+                    if request_id != self._list_request_id:
+                        return
+                    list_view.controls.extend(self._build_cards(
+                        rows[start:start + CARD_RENDER_CHUNK]))
+                    # Skip the update if the page was navigated away from
+                    if list_view.page:
+                        list_view.update()
+            except Exception:
+                logger.exception("Error rendering applicant cards")
+
+        threading.Thread(target=load, daemon=True).start()
+
+    def _build_applicants_list(self, loaded: tuple) -> ft.Control:
+        """Build the list of applicants for the current page from a cached page"""
+        return self._build_loaded_list(
+            (self.current_page, self.items_per_page), loaded)
+
+    def _build_loaded_list(self, key: Tuple[int, int], loaded: tuple, limit: Optional[int] = None) -> ft.Control:
+        """Cache a loaded page and build its list with pagination, rendering at most limit cards"""
+        self.applicants_list_view = None
+        self.applicants_total_text = None
+        self.current_page, self.total_applicants, applicants, has_applicants = loaded
+        if applicants:
+            self._cache_list_page(key, loaded)
+
+        self.total_pages = max(
+            1, (self.total_applicants + self.items_per_page - 1) // self.items_per_page)
+
+        # Update pagination info
+        self._update_pagination_controls()
+        # The loaded page is the one the user actually ends up on
+        self._save_pagination_preferences()
+
+        if not applicants:
+            return self._build_empty_state(has_applicants)
+
+        self.applicants_total_text = ft.Text(
+            f"Total: {self.total_applicants}", size=14, color=ft.Colors.GREY_600)
+        # ListView only lays out the cards that are in view
+        self.applicants_list_view = ft.ListView(
+            self._build_cards(applicants[:limit]), spacing=10, expand=True)
+
+        return ft.Column([
+            ft.Row([
+                ft.Text("Applicants", size=18,
+                        weight=ft.FontWeight.BOLD),
+                ft.Container(expand=True),
+                self.applicants_total_text
+            ]),
+            ft.Divider(),
+            ft.Container(
+                content=self.applicants_list_view,
+                expand=True
+            )
+        ], spacing=10, expand=True)
+
+    def _build_cards(self, applicants) -> list:
+        """Build cards for applicant rows"""
+        # Reuse cards built on earlier refreshes; locals avoid repeated
+        # attribute lookups inside the loop
+        _create = self._create_applicant_card
+        _cached = self._cached_card
+        cards = [None] * len(applicants)
+        for i, applicant in enumerate(applicants):
+            cards[i] = _cached(applicant.applicant_id) or _create(applicant)
+        return cards
+
+    def _cached_card(self, applicant_id: int) -> Optional[ft.Control]:
+        """Get a cached applicant card, marking it as recently used"""
+        with self._cache_lock:
+            card = self._card_cache.get(applicant_id)
+            if card is not None:
+                self._card_cache.move_to_end(applicant_id)
+            return card
+
+    def _cache_card(self, applicant_id: int, card: ft.Control):
+        """Remember an applicant card, evicting the least recently used ones"""
+        with self._cache_lock:
+            self._card_cache[applicant_id] = card
+            self._card_cache.move_to_end(applicant_id)
+            while len(self._card_cache) > CARD_CACHE_SIZE:
+                self._card_cache.popitem(last=False)
+
+    def _cached_list_page(self, key: Tuple[int, int]) -> Optional[tuple]:
+        """Get a cached page, marking it as recently used"""
+        with self._cache_lock:
+            loaded = self._list_cache.get(key)
+            if loaded is not None:
+                self._list_cache.move_to_end(key)
+            return loaded
+
+    def _cache_list_page(self, key: Tuple[int, int], loaded: tuple):
+        """Remember a loaded page, evicting the least recently used ones"""
+        with self._cache_lock:
+            self._list_cache[key] = loaded
+            self._list_cache.move_to_end(key)
+            while len(self._list_cache) > LIST_CACHE_SIZE:
+                self._list_cache.popitem(last=False)
+
+    def _build_loading_state(self) -> ft.Control:
+        """Build the placeholder shown while a page is loading"""
+        if self._loading_state is None:
+            self._loading_state = ft.Container(
+                content=ft.ProgressRing(),
+                alignment=ft.alignment.center,
+                expand=True
+            )
+        return self._loading_state
+
+    def _build_empty_state(self, has_applicants: bool) -> ft.Control:
+        """Build the empty list view (created once per variant and reused)"""
+        if has_applicants not in self._empty_states:
+            if not has_applicants:
+                self._empty_states[has_applicants] = ft.Container(
+                    content=ft.Column([
+                        ft.Icon(ft.Icons.PEOPLE_OUTLINE, size=64,
+                                color=ft.Colors.GREY_400),
+                        ft.Text("No applicants found", size=16,
+                                color=ft.Colors.GREY_600),
+                        ft.Text("Create a new applicant to get started",
+                                size=14, color=ft.Colors.GREY_500),
+                    ], horizontal_alignment=ft.CrossAxisAlignment.CENTER),
+                    alignment=ft.alignment.center,
+                    expand=True
+                )
+            else:
+                self._empty_states[has_applicants] = ft.Container(
+                    content=ft.Column([
+                        ft.Icon(ft.Icons.PEOPLE_OUTLINE, size=64,
+                                color=ft.Colors.GREY_400),
+                        ft.Text("No applicants on this page", size=16,
+                                color=ft.Colors.GREY_600),
+                    ], horizontal_alignment=ft.CrossAxisAlignment.CENTER),
+                    alignment=ft.alignment.center,
+                    expand=True
+                )
+        return self._empty_states[has_applicants]
+
+    def _build_error_view(self, message: str) -> ft.Control:
+        """Build the list error view, reusing it and only replacing the message"""
+        if self._error_view is None:
+            self._error_text = ft.Text(
+                "", size=12, color=ft.Colors.GREY_600)
+            self._error_view = ft.Container(
                 content=ft.Column([
                     ft.Icon(ft.Icons.ERROR, size=64, color=ft.Colors.RED_400),
                     ft.Text("Error loading applicants",
                             size=16, color=ft.Colors.RED_600),
-                    ft.Text(str(e), size=12, color=ft.Colors.GREY_600),
+                    self._error_text,
                 ], horizontal_alignment=ft.CrossAxisAlignment.CENTER),
                 alignment=ft.alignment.center,
                 expand=True
             )
+        self._error_text.value = message
+        return self._error_view
+
+    def _fetch_applicants_page(self, current_page: int, items_per_page: int) -> tuple:
+        """Load a page of applicants, returning (page, total, rows, has_applicants)"""
+        with self.session_factory() as db:
+            # Fetch the requested page first; the row count is only needed
+            # when it cannot be inferred from the page itself
+            offset = (current_page - 1) * items_per_page
+            applicants = self._query_applicants_page(
+                db, offset, items_per_page)
+
+            if not applicants and current_page > 1:
+                # Requested page is past the end, clamp to the last page
+                total = db.execute(_APPLICANTS_COUNT_STMT).scalar()
+                current_page = max(
+                    1, (total + items_per_page - 1) // items_per_page)
+                offset = (current_page - 1) * items_per_page
+                applicants = self._query_applicants_page(
+                    db, offset, items_per_page)
+            elif len(applicants) < items_per_page:
+                # Short (or empty first) page: this is the last page
+                total = offset + len(applicants)
+            else:
+                total = db.execute(_APPLICANTS_COUNT_STMT).scalar()
 
-    def _create_applicant_card(self, applicant: ApplicantProfile) -> ft.Control:
-        """Create a card for an applicant"""
-        # Get decrypted data for display
-        display_applicant = applicant.get_display_data()
-
-        full_name = f"{display_applicant.first_name or ''} {display_applicant.last_name or ''}".strip()
-        if not full_name:
-            full_name = f"Applicant #{display_applicant.applicant_id}"
-
-        # Build address display
-        address_display = []
-        if display_applicant.address:
-            address_display.append(
-                ft.Text(display_applicant.address, size=12,
-                        color=ft.Colors.GREY_600, max_lines=2)
-            )
+            if applicants:
+                return current_page, total, applicants, True
 
-        return ft.Card(
+            has_applicants = db.execute(_APPLICANTS_EXIST_STMT).scalar()
+            return current_page, total, applicants, has_applicants
+
+    def _query_applicants_page(self, db, offset: int, limit: int) -> list:
+        """Fetch one page of applicant rows with just the columns a card shows"""
+        return db.execute(
+            _APPLICANTS_PAGE_STMT.offset(offset).limit(limit)).all()
+
+    def _create_applicant_card(self, applicant, pending: bool = False) -> ft.Control:
+        """Create a card for an applicant row, with a spinner in place of the ID while it is being saved"""
+        # Get decrypted data for display
+        decrypt = encryption.decrypt if applicant.is_encrypted else str
+        first_name = decrypt(applicant.first_name or "")
+        last_name = decrypt(applicant.last_name or "")
+        address = decrypt(applicant.address or "")
+        phone_number = decrypt(applicant.phone_number or "")
+
+        full_name = (" ".join(filter(None, (first_name, last_name)))
+                     or f"Applicant #{applicant.applicant_id}")
+
+        # Build address display; only two lines are shown, so don't send
+        # the full text to the client
+        address_display = [
+            ft.Text(address[:ADDRESS_PREVIEW_LENGTH] + "…" if len(address) > ADDRESS_PREVIEW_LENGTH else address,
+                    **_CARD_ADDRESS_STYLE)
+        ] if address else []
+
+        card = ft.Card(
             content=ft.Container(
                 content=ft.Column([
                     ft.Row([
                         ft.Column([
-                            ft.Text(full_name, size=16,
-                                    weight=ft.FontWeight.BOLD),
-                            ft.Text(display_applicant.phone_number or "No phone",
-                                    size=14, color=ft.Colors.GREY_600),
+                            ft.Text(full_name, **_CARD_TITLE_STYLE),
+                            ft.Text(phone_number or "No phone",
+                                    **_CARD_DETAIL_STYLE),
                         ], expand=True),
                         ft.Column([
-                            ft.Text(f"ID: {display_applicant.applicant_id}",
-                                    size=12, color=ft.Colors.GREY_500),
-                            ft.Text(display_applicant.date_of_birth.strftime("%Y-%m-%d") if display_applicant.date_of_birth else "No DOB",
-                                    size=12, color=ft.Colors.GREY_500),
+                            ft.ProgressRing(width=14, height=14, stroke_width=2) if pending else
+                            ft.Text(f"ID: {applicant.applicant_id}",
+                                    **_CARD_META_STYLE),
+                            ft.Text(applicant.date_of_birth.isoformat() if applicant.date_of_birth else "No DOB",
+                                    **_CARD_META_STYLE),
                         ], horizontal_alignment=ft.CrossAxisAlignment.END),
                         # Address display (only if address exists)
                     ]),
@@ -283,6 +521,12 @@ class ApplicantsPage:
             elevation=2
         )
 
+        # Profiles are never edited in place, so a saved applicant's card can
+        # be reused instead of decrypting and rebuilding it on every refresh
+        if not pending:
+            self._cache_card(applicant.applicant_id, card)
+        return card
+
     def _build_pagination_controls(self) -> ft.Control:
         """Build pagination controls"""
         return ft.Container(
@@ -358,66 +602,152 @@ class ApplicantsPage:
         self.current_page = 1  # Reset to first page
         self._refresh_applicants_list()
 
-    def _on_create_applicant(self, e):
-        """Handle create applicant button click"""
+    def _load_pagination_preference(self, key: str, default: int) -> int:
+        """Read a stored pagination setting from client storage"""
         try:
-            # Validate required fields
-            if not self.first_name_field.value and not self.last_name_field.value:
-                self._show_error(
-                    "Please enter at least a first name or last name")
-                return            # Parse date of birth
-            date_of_birth = None
-            if self.date_of_birth_field.value:
-                date_of_birth = self.date_of_birth_field.value
-            elif self.date_display_field.value:
-                try:
-                    date_of_birth = datetime.strptime(
-                        self.date_display_field.value, "%Y-%m-%d").date()
-                except ValueError:
-                    self._show_error(
-                        "Invalid date format. Please select a valid date")
-                    return            # Create new applicant
-            db = self.session_factory()
-            try:
-                # Create applicant with plain data first
-                new_applicant = ApplicantProfile(
-                    first_name=self.first_name_field.value.strip(
-                    ) if self.first_name_field.value else None,
-                    last_name=self.last_name_field.value.strip(
-                    ) if self.last_name_field.value else None,
-                    date_of_birth=date_of_birth,
-                    address=self.address_field.value.strip() if self.address_field.value else None,
-                    phone_number=self.phone_number_field.value.strip(
-                    ) if self.phone_number_field.value else None,
-                )                # Encrypt the sensitive data before saving to database
-                encrypted_applicant = new_applicant.encrypt_data()
-                db.add(encrypted_applicant)
-                db.commit()
-                db.refresh(encrypted_applicant)
-
-                # Use the original (non-encrypted) data for display purposes
-                full_name = f"{new_applicant.first_name or ''} {new_applicant.last_name or ''}".strip(
-                )
-                self._show_success(
-                    f"Applicant '{full_name}' created successfully! (Data encrypted)")
+            return int(self.page.client_storage.get(key) or default)
+        except Exception as e:
+            print(f"Error loading preference '{key}': {e}")
+            return default
 
-                # Clear form
-                self._clear_form()
+    def _save_pagination_preferences(self):
+        """Persist the page size and current page to client storage if they changed"""
+        saved_page_size, saved_page = self._saved_preferences
+        try:
+            if self.items_per_page != saved_page_size:
+                self.page.client_storage.set(
+                    "applicants.page_size", self.items_per_page)
+            if self.current_page != saved_page:
+                self.page.client_storage.set(
+                    "applicants.last_page", self.current_page)
+            self._saved_preferences = (self.items_per_page, self.current_page)
+        except Exception as e:
+            print(f"Error saving pagination preferences: {e}")
 
-                # Refresh the applicants list
-                self._refresh_applicants_list()
+    def _on_create_applicant(self, e):
+        """Handle create applicant button click"""
+        # Validate required fields
+        if not self.first_name_field.value and not self.last_name_field.value:
+            self._show_error(
+                "Please enter at least a first name or last name")
+            return
+
+        # Date of birth is parsed when it is picked
+        date_of_birth = self._parsed_dob
+
+        # Create applicant with plain data first
+        new_applicant = ApplicantProfile(
+            first_name=self.first_name_field.value.strip(
+            ) if self.first_name_field.value else None,
+            last_name=self.last_name_field.value.strip(
+            ) if self.last_name_field.value else None,
+            date_of_birth=date_of_birth,
+            address=self.address_field.value.strip() if self.address_field.value else None,
+            phone_number=self.phone_number_field.value.strip(
+            ) if self.phone_number_field.value else None,
+        )
 
+        # Show the applicant immediately and save it in a separate thread to
+        # prevent UI blocking
+        self.create_button.disabled = True
+        pending_card = self._insert_pending_card(new_applicant)
+        self.page.update()
+
+        def save_applicant():
+            try:
+                applicant_id = self._save_applicant(new_applicant)
+            except Exception as ex:
+                self.create_button.disabled = False
+                self._remove_pending_card(pending_card)
+                self.page.update()
+                self._show_error(f"Error creating applicant: {str(ex)}")
                 if self.on_applicant_created_callback:
-                    self.on_applicant_created_callback(
-                        True, f"Applicant created with ID: {encrypted_applicant.applicant_id}")
+                    self.on_applicant_created_callback(False, str(ex))
+                return
+
+            self.create_button.disabled = False
+            self._update_list_cache_for_new_applicant()
+            new_applicant.applicant_id = applicant_id
+            self._confirm_pending_card(pending_card, new_applicant)
 
-            finally:
-                db.close()
+            # Use the original (non-encrypted) data for display purposes
+            full_name = " ".join(
+                filter(None, (new_applicant.first_name, new_applicant.last_name)))
+            self._clear_form()
+            self._show_success(
+                f"Applicant '{full_name}' created successfully! (Data encrypted)")
 
-        except Exception as ex:
-            self._show_error(f"Error creating applicant: {str(ex)}")
             if self.on_applicant_created_callback:
-                self.on_applicant_created_callback(False, str(ex))
+                self.on_applicant_created_callback(
+                    True, f"Applicant created with ID: {applicant_id}")
+
+        threading.Thread(target=save_applicant, daemon=True).start()
+
+    def _save_applicant(self, applicant: ApplicantProfile) -> int:
+        """Encrypt and store an applicant, returning the new applicant ID"""
+        with self.session_factory() as db:
+            # Encrypt the sensitive data before saving to database
+            encrypted_applicant = applicant.encrypt_data()
+            db.add(encrypted_applicant)
+            # The INSERT already populates the generated key; read it before
+            # commit expires the instance so no follow-up SELECT is issued
+            db.flush()
+            applicant_id = encrypted_applicant.applicant_id
+            db.commit()
+            return applicant_id
+
+    def _update_list_cache_for_new_applicant(self):
+        """Patch cached pages after an insert instead of dropping them all"""
+        # New applicants get the highest ID, so only a short (last) page
+        # gains a row; every other cached page just has a larger total
+        with self._cache_lock:
+            for key, (page, total, rows, has_rows) in list(self._list_cache.items()):
+                if len(rows) < key[1]:
+                    del self._list_cache[key]
+                else:
+                    self._list_cache[key] = (page, total + 1, rows, has_rows)
+
+    def _insert_pending_card(self, applicant: ApplicantProfile):
+        """Show a card for an applicant that is still being saved"""
+        if not self.applicants_list_view:
+            return None
+
+        # New applicants get the highest ID, so the card only belongs at the
+        # end of a fully rendered last page that still has room
+        shown = self.total_applicants - (self.current_page - 1) * self.items_per_page
+        if (self.current_page != self.total_pages or shown >= self.items_per_page
+                or len(self.applicants_list_view.controls) != shown):
+            return None
+
+        card = self._create_applicant_card(applicant, pending=True)
+        self.applicants_list_view.controls.append(card)
+        return card
+
+    def _remove_pending_card(self, card):
+        """Roll back an optimistic card after a failed save"""
+        if card is not None and self.applicants_list_view and card in self.applicants_list_view.controls:
+            self.applicants_list_view.controls.remove(card)
+
+    def _confirm_pending_card(self, card, applicant: ApplicantProfile):
+        """Replace an optimistic card with the saved applicant"""
+        if card is None or not self.applicants_list_view or card not in self.applicants_list_view.controls:
+            # The applicant is not on the shown page, so go to the last page
+            # where it was added
+            self.current_page = max(
+                1, (self.total_applicants + self.items_per_page) // self.items_per_page)
+            self._refresh_applicants_list()
+            return
+
+        index = self.applicants_list_view.controls.index(card)
+        self.applicants_list_view.controls[index] = self._create_applicant_card(
+            applicant)
+
+        self.total_applicants += 1
+        self.total_pages = max(
+            1, (self.total_applicants + self.items_per_page - 1) // self.items_per_page)
+        self._update_pagination_controls()
+        if self.applicants_total_text:
+            self.applicants_total_text.value = f"Total: {self.total_applicants}"
 
     def _on_clear_form(self, e):
         """Handle clear form button click"""
@@ -429,6 +759,7 @@ class ApplicantsPage:
         self.last_name_field.value = ""
         self.date_display_field.value = ""
         self.date_of_birth_field.value = None
+        self._parsed_dob = None
         self.address_field.value = ""
         self.phone_number_field.value = ""
 
@@ -439,7 +770,7 @@ class ApplicantsPage:
         try:
             if self.applicants_list_container:
                 # Update the content of the applicants list container
-                self.applicants_list_container.content = self._build_applicants_list()
+                self._load_applicants_list()
                 self.page.update()
         except Exception as e:
             print(f"Error refreshing applicants list: {e}")
@@ -448,31 +779,27 @@ class ApplicantsPage:
 
     def _show_success(self, message: str):
         """Show success message"""
-        self.page.snack_bar = ft.SnackBar(
-            content=ft.Text(message),
-            bgcolor=ft.Colors.GREEN_100
-        )
-        self.page.snack_bar.open = True
-        self.page.update()
+        self._show_snack_bar(message, ft.Colors.GREEN_100)
 
     def _show_error(self, message: str):
         """Show error message"""
-        self.page.snack_bar = ft.SnackBar(
-            content=ft.Text(message),
-            bgcolor=ft.Colors.RED_100
-        )
-        self.page.snack_bar.open = True
-        self.page.update()
+        self._show_snack_bar(message, ft.Colors.RED_100)
+
+    def _show_snack_bar(self, message: str, bgcolor: str):
+        """Show a message in the page's reusable snack bar"""
+        # page.open() only sends the snack bar itself to the client instead
+        # of diffing the whole page
+        self.snack_bar.content.value = message
+        self.snack_bar.bgcolor = bgcolor
+        self.page.open(self.snack_bar)
 
     def _open_date_picker(self, e):
         """Open the date picker"""
-        self.page.overlay.append(self.date_of_birth_field)
-        self.date_of_birth_field.open = True
-        self.page.update()
+        self.page.open(self.date_of_birth_field)
 
     def _on_date_selected(self, e):
         """Handle date selection from date picker"""
         if self.date_of_birth_field.value:
-            self.date_display_field.value = self.date_of_birth_field.value.strftime(
-                "%Y-%m-%d")
-            self.page.update()
+            self._parsed_dob = self.date_of_birth_field.value.date()
+            self.date_display_field.value = self._parsed_dob.isoformat()
+            self.date_display_field.update()
@@ -1,39 +1,90 @@
 import flet as ft
-from typing import Callable, Dict, Optional
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Tuple
+from sqlalchemy import func, select
+from sqlalchemy.orm import contains_eager, load_only
 from database.models.applicant import ApplicantProfile, ApplicantDetail
 from gui.components.upload_section import UploadSection
 
+# Loaded pages kept around: the current page and its neighbours
+PAGE_CACHE_SIZE = 3
+# Applicants listed in the dropdown at once; the rest are found by searching
+MAX_DROPDOWN_OPTIONS = 25
+# Delay before a new page size is applied
+ITEMS_PER_PAGE_DEBOUNCE_SECONDS = 0.2
+
+# Profile columns needed to show an applicant's name
+_PROFILE_NAME_COLUMNS = (
+    ApplicantProfile.applicant_id,
+    ApplicantProfile.first_name,
+    ApplicantProfile.last_name,
+    ApplicantProfile.is_encrypted,
+)
+# Names are stored encrypted, so the profiles are sorted after decrypting
+_PROFILE_NAMES_STMT = select(ApplicantProfile).options(
+    load_only(*_PROFILE_NAME_COLUMNS))
+
 
 class ApplicationsPage:
     """Applications management page for CV uploads and application details"""
 
-    def __init__(self, page: ft.Page, session_factory, cv_processor, on_view_detail: Callable):
+    def __init__(self, page: ft.Page, session_factory, on_view_detail: Callable):
         self.page = page
         self.session_factory = session_factory
-        self.cv_processor = cv_processor
         self.on_view_detail = on_view_detail
 
         # State
         self.selected_applicant_id = None
         self.applicant_profiles = []
+        self.applicant_search = ""
+        self._profiles_loaded = False
+        # Last built dropdown options and the (search, selection) they are for
+        self._dropdown_options: Optional[List[ft.dropdown.Option]] = None
+        self._dropdown_options_key: Optional[Tuple[str, Optional[int]]] = None
+        # Decrypted display names by applicant_id
+        self._display_cache: Dict[int, str] = {}
 
         # Pagination state
         self.current_page = 1
         self.items_per_page = 10
         self.total_applications = 0
         self.total_pages = 0
+        self.has_next_page = False
+        # detail_id each visited page starts below (keyset pagination); pages
+        # without a known cursor fall back to OFFSET
+        self.page_cursors: Dict[int, Optional[int]] = {1: None}
+        # Incremented per background page load so stale results are dropped
+        self._list_request_id = 0
+        # Recently loaded and prefetched pages by (page, items_per_page);
+        # the generation is bumped whenever the cache is invalidated
+        self._page_cache: OrderedDict = OrderedDict()
+        self._page_cache_lock = threading.Lock()
+        self._page_cache_generation = 0
 
         # UI component references for dynamic updates
         self.applications_list_container = None
         self.applicant_dropdown = None
+        self.applicant_search_field = None
         self.pagination_info = None
         self.prev_button = None
         self.next_button = None
         self.page_input = None
+        self.pagination_bar = None
+        self._items_per_page_timer: Optional[threading.Timer] = None
+
+        # Applications list view, built on first use and reused
+        self._apps_list_view = None
+        self._apps_inner_column = None
+        self._apps_total_text = None
+        # Application cards reused across pages, see _fill_application_card
+        self._card_pool: List[Dict[str, ft.Control]] = []
+        # Empty-page views by whether there are no applications at all
+        self._empty_views: Dict[bool, ft.Control] = {}
 
         # Initialize upload section
         self.upload_section = UploadSection(
-            self.page, self.cv_processor, self.on_cv_uploaded, self.get_selected_applicant_id
+            self.page, self.on_cv_uploaded, self.get_selected_applicant_id
         )
 
         # Callback for when upload completes
@@ -67,7 +118,6 @@ class ApplicationsPage:
 
         # Create the applications list container
         self.applications_list_container = ft.Container(
-            content=self._build_applications_list(),
             expand=True,
             padding=20,
             border=ft.border.all(1, ft.Colors.GREY_300),
@@ -75,6 +125,7 @@ class ApplicationsPage:
             margin=ft.Margin(20, 0, 0, 0),
             height=600
         )
+        self._load_applications_list()
 
         return ft.Column([
             # Header
@@ -113,172 +164,354 @@ class ApplicationsPage:
                 ], expand=True),
                 padding=10,
                 expand=True
-            )], expand=True, scroll=ft.ScrollMode.AUTO)
+            )], expand=True)
 
     def _build_applicant_selector(self) -> ft.Control:
         """Build applicant selection dropdown"""
-        self._load_applicant_profiles()
-
-        options = [
-            ft.dropdown.Option(key="random", text="Random Applicant"),
-        ]
-
-        for profile in self.applicant_profiles:
-            # Get decrypted data for display
-            display_profile = profile.get_display_data()
-            full_name = f"{display_profile.first_name or ''} {display_profile.last_name or ''}".strip(
-            )
-            if not full_name:
-                full_name = f"Applicant #{display_profile.applicant_id}"
-            options.append(
-                ft.dropdown.Option(
-                    # Use original profile for ID
-                    key=str(profile.applicant_id),
-                    text=full_name
-                )
-            )
-
+        self.applicant_search_field = ft.TextField(
+            label="Search applicants",
+            value=self.applicant_search,
+            width=350,
+            prefix_icon=ft.Icons.SEARCH,
+            on_change=self._on_applicant_search
+        )
         self.applicant_dropdown = ft.Dropdown(
             label="Choose applicant for new application",
-            options=options,
+            options=self._build_dropdown_options(),
             on_change=self._on_applicant_selected,
             width=350
         )
 
+        # Profiles are loaded once in a separate thread to prevent UI
+        # blocking; later builds reuse them until they are refreshed
+        if not self._profiles_loaded:
+            threading.Thread(
+                target=self.refresh_applicant_dropdown, daemon=True).start()
+
         return ft.Column([
             ft.Text("Select Applicant", size=16, weight=ft.FontWeight.BOLD),
+            self.applicant_search_field,
             self.applicant_dropdown,
         ], spacing=10)
 
-    def _build_applications_list(self) -> ft.Control:
-        """Build the list of applications (ApplicantDetail records) with pagination"""
-        try:
-            db = self.session_factory()
+    def _build_dropdown_options(self) -> List[ft.dropdown.Option]:
+        """Build dropdown options for the loaded profiles matching the search text"""
+        # Names are encrypted in the database, so matching happens here on
+        # the cached decrypted names; the dropdown only ever gets a bounded
+        # number of options
+        key = (self.applicant_search.lower(), self.selected_applicant_id)
+        if self._dropdown_options is not None and key == self._dropdown_options_key:
+            return self._dropdown_options
+
+        search = key[0]
+        options = [ft.dropdown.Option(key="random", text="Random Applicant")]
+        for profile in self.applicant_profiles:
+            full_name = self._display_name(profile)
+            if profile.applicant_id == self.selected_applicant_id or (
+                    len(options) <= MAX_DROPDOWN_OPTIONS and search in full_name.lower()):
+                options.append(ft.dropdown.Option(
+                    key=str(profile.applicant_id), text=full_name))
+
+        self._dropdown_options_key = key
+        self._dropdown_options = options
+        return options
+
+    def _on_applicant_search(self, e):
+        """Narrow the applicant dropdown to names containing the search text"""
+        self.applicant_search = e.control.value or ""
+        self.applicant_dropdown.options = self._build_dropdown_options()
+        self.applicant_dropdown.update()
+
+    def _load_applications_list(self):
+        """Fill the list container, querying the database in a separate thread on a cache miss"""
+        # Newer requests (e.g. quick page flips) supersede this one
+        self._list_request_id += 1
+        request_id = self._list_request_id
+        key = (self.current_page, self.items_per_page)
+        with self._page_cache_lock:
+            loaded = self._page_cache.get(key)
+        if loaded:
+            self.applications_list_container.content = self._build_loaded_list(
+                loaded)
+            self._prefetch_adjacent_pages()
+            return
+
+        args = key + (self.page_cursors.get(self.current_page),)
+        self.applications_list_container.content = self._build_loading_state()
+
+        def load():
             try:
-                # Get total count for pagination
-                self.total_applications = db.query(ApplicantDetail).count()
-                self.total_pages = max(
-                    1, (self.total_applications + self.items_per_page - 1) // self.items_per_page)
-
-                # Ensure current page is within bounds
-                self.current_page = max(
-                    1, min(self.current_page, self.total_pages))
-
-                # Calculate offset for pagination
-                offset = (self.current_page - 1) * self.items_per_page
-
-                # Get paginated applications
-                applications = db.query(ApplicantDetail).join(ApplicantProfile).order_by(
-                    ApplicantDetail.detail_id.desc()).offset(offset).limit(self.items_per_page).all()
-
-                # Update pagination info
-                self._update_pagination_controls()
-
-                if not applications:
-                    if self.total_applications == 0:
-                        return ft.Container(
-                            content=ft.Column([
-                                ft.Icon(ft.Icons.FOLDER_OPEN, size=64,
-                                        color=ft.Colors.GREY_400),
-                                ft.Text("No applications found", size=16,
-                                        color=ft.Colors.GREY_600),
-                                ft.Text("Upload a CV to get started",
-                                        size=14, color=ft.Colors.GREY_500),
-                            ], horizontal_alignment=ft.CrossAxisAlignment.CENTER),
-                            alignment=ft.alignment.center,
-                            expand=True
-                        )
-                    else:
-                        return ft.Container(
-                            content=ft.Column([
-                                ft.Icon(ft.Icons.FOLDER_OPEN, size=64,
-                                        color=ft.Colors.GREY_400),
-                                ft.Text("No applications on this page", size=16,
-                                        color=ft.Colors.GREY_600),
-                            ], horizontal_alignment=ft.CrossAxisAlignment.CENTER),
-                            alignment=ft.alignment.center,
-                            expand=True
-                        )
-
-                return ft.Column([
-                    ft.Row([
-                        ft.Text("Applications", size=18,
-                                weight=ft.FontWeight.BOLD),
-                        ft.Container(expand=True),
-                        ft.Text(f"Total: {self.total_applications}",
-                                size=14, color=ft.Colors.GREY_600)
-                    ]),
-                    ft.Divider(),
-                    ft.Container(
-                        content=ft.Column([
-                            self._build_application_card(app) for app in applications
-                        ], spacing=10, scroll=ft.ScrollMode.AUTO),
-                        expand=True
-                    )
-                ], spacing=10, expand=True)
-
-            finally:
-                db.close()
-        except Exception as e:
-            return ft.Container(
+                loaded = self._fetch_applications_page(*args)
+            except Exception as e:
+                if request_id != self._list_request_id:
+                    return
+                content = self._build_error_view(str(e))
+            else:
+                if request_id != self._list_request_id:
+                    return
+                self._cache_page(key, loaded)
+                content = self._build_loaded_list(loaded)
+
+            self.applications_list_container.content = content
+            self._update_list_view()
+            self._prefetch_adjacent_pages()
+
+        threading.Thread(target=load, daemon=True).start()
+
+    def _update_list_view(self):
+        """Send the list and pagination controls to the client without diffing the whole page"""
+        # Before the page is shown there is nothing to update yet
+        if self.applications_list_container.page:
+            self.applications_list_container.update()
+            self.pagination_bar.update()
+
+    def _cache_page(self, key: Tuple[int, int], loaded: tuple):
+        """Remember a loaded page, evicting the least recently used ones"""
+        with self._page_cache_lock:
+            self._page_cache[key] = loaded
+            self._page_cache.move_to_end(key)
+            while len(self._page_cache) > PAGE_CACHE_SIZE:
+                self._page_cache.popitem(last=False)
+
+    def _prefetch_adjacent_pages(self):
+        """Load the previous and next pages in the background so paging is instant"""
+        pages = []
+        if self.current_page > 1:
+            pages.append(self.current_page - 1)
+        if self.has_next_page:
+            pages.append(self.current_page + 1)
+
+        for page in pages:
+            key = (page, self.items_per_page)
+            with self._page_cache_lock:
+                if key in self._page_cache:
+                    continue
+            args = key + (self.page_cursors.get(page),)
+            generation = self._page_cache_generation
+
+            def prefetch(key=key, args=args, generation=generation):
+                try:
+                    loaded = self._fetch_applications_page(*args)
+                except Exception as e:
+                    print(f"Error prefetching applications page: {e}")
+                    return
+                # Drop pages fetched before the cache was invalidated
+                if loaded[2] and generation == self._page_cache_generation:
+                    self._cache_page(key, loaded)
+
+            threading.Thread(target=prefetch, daemon=True).start()
+
+    def _fetch_applications_page(self, current_page: int, items_per_page: int, cursor: Optional[int]) -> tuple:
+        """Load a page of applications, returning (page, total, applications, has_next_page)"""
+        with self.session_factory() as db:
+            rows, total = self._query_applications_page(
+                db, current_page, items_per_page, cursor)
+            if not rows and current_page > 1:
+                # Requested page is past the end, go to the last page
+                total = db.query(ApplicantDetail).join(
+                    ApplicantProfile).count()
+                current_page = max(
+                    1, (total + items_per_page - 1) // items_per_page)
+                rows, total = self._query_applications_page(
+                    db, current_page, items_per_page, None)
+
+            applications = [
+                row.ApplicantDetail for row in rows[:items_per_page]]
+            return current_page, total, applications, len(rows) > items_per_page
+
+    def _query_applications_page(self, db, current_page: int, items_per_page: int, cursor: Optional[int]) -> Tuple[list, int]:
+        """Fetch a page (plus one row) and the total application count"""
+        # Seek past the previous page's last ID when it is known; one extra
+        # row tells whether there is a next page
+        remaining = func.count().over().label("total")
+        # The profile is loaded from the join instead of one lazy query per card
+        query = db.query(ApplicantDetail, remaining).join(ApplicantDetail.profile).options(
+            contains_eager(ApplicantDetail.profile).load_only(*_PROFILE_NAME_COLUMNS)
+        ).order_by(ApplicantDetail.detail_id.desc())
+        skipped = (current_page - 1) * items_per_page
+        if cursor is not None:
+            # The window count only sees rows below the cursor
+            query = query.filter(ApplicantDetail.detail_id < cursor)
+        else:
+            query = query.offset(skipped)
+            skipped = 0
+        rows = query.limit(items_per_page + 1).all()
+
+        # Every row carries the window count, so no separate COUNT query
+        # is needed
+        return rows, skipped + rows[0].total if rows else 0
+
+    def _clear_page_cache(self):
+        """Forget all loaded pages after the applications changed"""
+        with self._page_cache_lock:
+            self._page_cache_generation += 1
+            self._page_cache.clear()
+
+    def _build_loaded_list(self, loaded: tuple) -> ft.Control:
+        """Build the list of applications (ApplicantDetail records) for a loaded page"""
+        self.current_page, self.total_applications, applications, self.has_next_page = loaded
+        self.total_pages = max(
+            1, (self.total_applications + self.items_per_page - 1) // self.items_per_page)
+        if self.has_next_page:
+            self.page_cursors[self.current_page +
+                              1] = applications[-1].detail_id
+
+        # Update pagination info
+        self._update_pagination_controls()
+
+        if not applications:
+            return self._build_empty_view(self.total_applications == 0)
+
+        # Only the cards and the total change between pages, the rest of
+        # the list view is built once
+        if self._apps_list_view is None:
+            self._apps_total_text = ft.Text(
+                "", size=14, color=ft.Colors.GREY_600)
+            # ListView only lays out the cards that are in view
+            self._apps_inner_column = ft.ListView(spacing=10, expand=True)
+            self._apps_list_view = ft.Column([
+                ft.Row([
+                    ft.Text("Applications", size=18,
+                            weight=ft.FontWeight.BOLD),
+                    ft.Container(expand=True),
+                    self._apps_total_text
+                ]),
+                ft.Divider(),
+                ft.Container(
+                    content=self._apps_inner_column,
+                    expand=True
+                )
+            ], spacing=10, expand=True)
+
+        self._apps_total_text.value = f"Total: {self.total_applications}"
+        self._apps_inner_column.controls = [
+            self._fill_application_card(i, app) for i, app in enumerate(applications)
+        ]
+        return self._apps_list_view
+
+    def _build_empty_view(self, no_applications: bool) -> ft.Control:
+        """Build the view shown for an empty page, reusing it once built"""
+        view = self._empty_views.get(no_applications)
+        if view is None:
+            if no_applications:
+                messages = [
+                    ft.Text("No applications found", size=16,
+                            color=ft.Colors.GREY_600),
+                    ft.Text("Upload a CV to get started",
+                            size=14, color=ft.Colors.GREY_500),
+                ]
+            else:
+                messages = [
+                    ft.Text("No applications on this page", size=16,
+                            color=ft.Colors.GREY_600),
+                ]
+            view = ft.Container(
                 content=ft.Column([
-                    ft.Icon(ft.Icons.ERROR, size=64, color=ft.Colors.RED_400),
-                    ft.Text("Error loading applications",
-                            size=16, color=ft.Colors.RED_600),
-                    ft.Text(str(e), size=12, color=ft.Colors.GREY_600),
+                    ft.Icon(ft.Icons.FOLDER_OPEN, size=64,
+                            color=ft.Colors.GREY_400),
+                    *messages,
                 ], horizontal_alignment=ft.CrossAxisAlignment.CENTER),
                 alignment=ft.alignment.center,
                 expand=True
             )
+            self._empty_views[no_applications] = view
+        return view
 
-    def _build_application_card(self, application: ApplicantDetail) -> ft.Control:
-        """Build a card for an application"""        # Get applicant name
-        applicant_name = "Unknown"
-        if application.profile:
-            # Get decrypted data for display
-            display_profile = application.profile.get_display_data()
-            full_name = f"{display_profile.first_name or ''} {display_profile.last_name or ''}".strip(
-            )
-            applicant_name = full_name if full_name else f"Applicant #{display_profile.applicant_id}"
+    def _build_loading_state(self) -> ft.Control:
+        """Build the placeholder shown while a page is loading"""
+        return ft.Container(
+            content=ft.ProgressRing(),
+            alignment=ft.alignment.center,
+            expand=True
+        )
 
-        return ft.Card(
+    def _build_error_view(self, message: str) -> ft.Control:
+        """Build the view shown when applications fail to load"""
+        return ft.Container(
+            content=ft.Column([
+                ft.Icon(ft.Icons.ERROR, size=64, color=ft.Colors.RED_400),
+                ft.Text("Error loading applications",
+                        size=16, color=ft.Colors.RED_600),
+                ft.Text(message, size=12, color=ft.Colors.GREY_600),
+            ], horizontal_alignment=ft.CrossAxisAlignment.CENTER),
+            alignment=ft.alignment.center,
+            expand=True
+        )
+
+    def _build_application_card(self) -> Dict[str, ft.Control]:
+        """Build an empty application card and the controls that are filled per application"""
+        entry = {
+            "name": ft.Text("", size=16, weight=ft.FontWeight.BOLD),
+            "role": ft.Text("", size=14, color=ft.Colors.GREY_600),
+            "id": ft.Text("", size=12, color=ft.Colors.GREY_500),
+            "button": ft.ElevatedButton(
+                "View Details", icon=ft.Icons.VISIBILITY, on_click=self._on_view_click),
+        }
+        entry["card"] = ft.Card(
             content=ft.Container(
                 content=ft.Column([
                     ft.Row([
                         ft.Column([
-                            ft.Text(applicant_name, size=16,
-                                    weight=ft.FontWeight.BOLD),
-                            ft.Text(application.application_role or "No role specified",
-                                    size=14, color=ft.Colors.GREY_600),
-                        ], expand=True),                        ft.Column([
-                            ft.Text(f"ID: {application.detail_id}",
-                                    size=12, color=ft.Colors.GREY_500),
+                            entry["name"],
+                            entry["role"],
+                        ], expand=True),
+                        ft.Column([
+                            entry["id"],
                         ], horizontal_alignment=ft.CrossAxisAlignment.END),
                     ]),
 
                     ft.Row([
-                        ft.ElevatedButton(
-                            "View Details",
-                            icon=ft.Icons.VISIBILITY,
-                            on_click=lambda e, app_id=application.detail_id: self.on_view_detail(
-                                app_id)
-                        ),
+                        entry["button"],
                     ], alignment=ft.MainAxisAlignment.END)
                 ], spacing=10),
                 padding=15
-            ),            elevation=2
+            ),
+            elevation=2
         )
+        return entry
+
+    def _fill_application_card(self, index: int, application: ApplicantDetail) -> ft.Control:
+        """Show an application in the pooled card at index, growing the pool if needed"""
+        # Cards are reused across pages; only their values change
+        while len(self._card_pool) <= index:
+            self._card_pool.append(self._build_application_card())
+        entry = self._card_pool[index]
+
+        applicant_name = "Unknown"
+        if application.profile:
+            applicant_name = self._display_name(application.profile)
+
+        entry["name"].value = applicant_name
+        entry["role"].value = application.application_role or "No role specified"
+        entry["id"].value = f"ID: {application.detail_id}"
+        entry["button"].data = application.detail_id
+        return entry["card"]
+
+    def _on_view_click(self, e):
+        """Open the application whose ID is stored on the clicked card's button"""
+        self.on_view_detail(e.control.data)
+
+    def _display_name(self, profile) -> str:
+        """Get an applicant's decrypted display name, decrypting each profile only once"""
+        full_name = self._display_cache.get(profile.applicant_id)
+        if full_name is None:
+            # Only the name columns are loaded, so decrypt just those
+            full_name = profile.full_name or f"Applicant #{profile.applicant_id}"
+            self._display_cache[profile.applicant_id] = full_name
+        return full_name
 
     def _load_applicant_profiles(self):
         """Load all applicant profiles for the dropdown"""
         try:
-            db = self.session_factory()
-            try:
-                self.applicant_profiles = db.query(ApplicantProfile).order_by(
-                    ApplicantProfile.first_name, ApplicantProfile.last_name
-                ).all()
-            finally:
-                db.close()
+            with self.session_factory() as db:
+                profiles = db.scalars(_PROFILE_NAMES_STMT).all()
+            # Decrypt every name in one pass here, off the UI thread, so that
+            # building and searching the dropdown only does cache lookups,
+            # and order by the names the user sees
+            self.applicant_profiles = sorted(
+                profiles, key=lambda profile: self._display_name(profile).lower())
+            self._profiles_loaded = True
+            self._dropdown_options = None
         except Exception as e:
             print(f"Error loading applicant profiles: {e}")
             self.applicant_profiles = []
@@ -300,47 +533,74 @@ class ApplicationsPage:
 
         # Refresh the applications list
         if success:
+            # New applications shift every page, so the cursors are stale;
+            # cached display names stay valid since uploads never edit profiles
+            self.page_cursors = {1: None}
+            with self._page_cache_lock:
+                first_page = self._page_cache.get((1, self.items_per_page))
+            self._clear_page_cache()
             try:
-                # Update the applications list content
-                new_applications_content = self._build_applications_list()
-                self.applications_list_container.content = new_applications_content
+                detail_id = (applicant_data or {}).get("detail_id")
+                if self.current_page == 1 and first_page and detail_id:
+                    self._show_uploaded_application(detail_id, first_page)
+                else:
+                    # Update the applications list content; the page itself
+                    # is loaded in a separate thread
+                    self._load_applications_list()
+                    self._update_list_view()
+
+                # Also refresh the applicant dropdown in case new applicants
+                # were created, without holding up the list
+                threading.Thread(
+                    target=self.refresh_applicant_dropdown, daemon=True).start()
+            except Exception as e:
+                print(f"Error refreshing applications list: {e}")
 
-                # Also refresh the applicant dropdown in case new applicants were created
-                self._refresh_applicant_dropdown()
+    def _show_uploaded_application(self, detail_id: int, first_page: tuple):
+        """Put a newly uploaded application at the top of the shown first page instead of reloading it"""
+        # Newer requests (e.g. a page flip) supersede this one
+        self._list_request_id += 1
+        request_id = self._list_request_id
+        key = (1, self.items_per_page)
 
-                self.page.update()
+        def load():
+            try:
+                with self.session_factory() as db:
+                    application = db.query(ApplicantDetail).join(ApplicantDetail.profile).options(
+                        contains_eager(ApplicantDetail.profile).load_only(*_PROFILE_NAME_COLUMNS)
+                    ).filter(ApplicantDetail.detail_id == detail_id).first()
             except Exception as e:
-                print(f"Error refreshing applications list: {e}")
+                print(f"Error loading uploaded application: {e}")
+                application = None
+            if request_id != self._list_request_id:
+                return
+
+            if application is None:
+                # Reload the whole page instead
+                self._load_applications_list()
+                self._update_list_view()
+                return
+
+            # Newest applications come first, so the upload pushes the last
+            # card of the page onto the next one
+            _, total, applications, has_next_page = first_page
+            applications = [application] + applications
+            loaded = (1, total + 1, applications[:key[1]],
+                      has_next_page or len(applications) > key[1])
+            self._cache_page(key, loaded)
+            self.applications_list_container.content = self._build_loaded_list(
+                loaded)
+            self._update_list_view()
+
+        threading.Thread(target=load, daemon=True).start()
 
     def _refresh_applicant_dropdown(self):
         """Refresh the applicant dropdown with latest data"""
         try:
-            self._load_applicant_profiles()
-
-            # Rebuild dropdown options
-            options = [
-                ft.dropdown.Option(key="random", text="Random Applicant"),
-            ]
-
-            for profile in self.applicant_profiles:
-                # Get decrypted data for display
-                display_profile = profile.get_display_data()
-                full_name = f"{display_profile.first_name or ''} {display_profile.last_name or ''}".strip(
-                )
-                if not full_name:
-                    full_name = f"Applicant #{display_profile.applicant_id}"
-                options.append(
-                    ft.dropdown.Option(
-                        # Use original profile for ID
-                        key=str(profile.applicant_id),
-                        text=full_name
-                    )
-                )
-
-            # Update dropdown options
+            # Nothing to refresh before the page has been built
             if self.applicant_dropdown:
-                self.applicant_dropdown.options = options
-
+                self._load_applicant_profiles()
+                self.applicant_dropdown.options = self._build_dropdown_options()
         except Exception as e:
             print(f"Error refreshing applicant dropdown: {e}")
 
@@ -350,37 +610,13 @@ class ApplicationsPage:
 
     def refresh_applicant_dropdown(self):
         """Refresh the applicant dropdown with updated data"""
-        try:
-            if self.applicant_dropdown:
-                self._load_applicant_profiles()
-
-                options = [
-                    ft.dropdown.Option(key="random", text="Random Applicant"),
-                ]
-
-                for profile in self.applicant_profiles:
-                    # Get decrypted data for display
-                    display_profile = profile.get_display_data()
-                    full_name = f"{display_profile.first_name or ''} {display_profile.last_name or ''}".strip(
-                    )
-                    if not full_name:
-                        full_name = f"Applicant #{display_profile.applicant_id}"
-                    options.append(
-                        ft.dropdown.Option(
-                            # Use original profile for ID
-                            key=str(profile.applicant_id),
-                            text=full_name
-                        )
-                    )
-
-                self.applicant_dropdown.options = options
-                self.page.update()
-        except Exception as e:
-            print(f"Error refreshing applicant dropdown: {e}")
+        if self.applicant_dropdown:
+            self._refresh_applicant_dropdown()
+            self.page.update()
 
     def _build_pagination_controls(self) -> ft.Control:
         """Build pagination controls"""
-        return ft.Container(
+        self.pagination_bar = ft.Container(
             content=ft.Row([
                 self.prev_button,
                 self.pagination_info,
@@ -403,6 +639,7 @@ class ApplicationsPage:
             padding=10,
             border=ft.border.only(top=ft.BorderSide(1, ft.Colors.GREY_300))
         )
+        return self.pagination_bar
 
     def _update_pagination_controls(self):
         """Update pagination control states"""
@@ -416,7 +653,7 @@ class ApplicationsPage:
             self.prev_button.disabled = self.current_page <= 1
 
         if self.next_button:
-            self.next_button.disabled = self.current_page >= self.total_pages
+            self.next_button.disabled = not self.has_next_page
 
         if self.page_input:
             self.page_input.value = str(self.current_page)
@@ -429,7 +666,7 @@ class ApplicationsPage:
 
     def _on_next_page(self, e):
         """Handle next page button click"""
-        if self.current_page < self.total_pages:
+        if self.has_next_page:
             self.current_page += 1
             self._refresh_applications_list()
 
@@ -442,22 +679,33 @@ class ApplicationsPage:
                 self._refresh_applications_list()
             else:
                 self.page_input.value = str(self.current_page)
-                self.page.update()
+                self.page_input.update()
         except ValueError:
             self.page_input.value = str(self.current_page)
-            self.page.update()
+            self.page_input.update()
 
     def _on_items_per_page_change(self, e):
         """Handle items per page change"""
-        self.items_per_page = int(e.control.value)
+        # Only reload for the last value picked in quick succession
+        if self._items_per_page_timer:
+            self._items_per_page_timer.cancel()
+        self._items_per_page_timer = threading.Timer(
+            ITEMS_PER_PAGE_DEBOUNCE_SECONDS, self._apply_items_per_page, args=(int(e.control.value),))
+        self._items_per_page_timer.daemon = True
+        self._items_per_page_timer.start()
+
+    def _apply_items_per_page(self, items_per_page: int):
+        """Switch to a new page size and reload from the first page"""
+        self.items_per_page = items_per_page
         self.current_page = 1  # Reset to first page
+        self.page_cursors = {1: None}
         self._refresh_applications_list()
 
     def _refresh_applications_list(self):
         """Refresh the applications list"""
         try:
             if self.applications_list_container:
-                self.applications_list_container.content = self._build_applications_list()
-                self.page.update()
+                self._load_applications_list()
+                self._update_list_view()
         except Exception as e:
             print(f"Error refreshing applications list: {e}")
@@ -1,7 +1,8 @@
 import flet as ft
 import os
+import threading
 from typing import Callable, Dict, Any, Optional
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 from database.models.applicant import ApplicantProfile, ApplicantDetail
 from gui.components.detail_view import DetailView
 from core.search_engine import SearchEngine
@@ -14,26 +15,68 @@ from utils.type_safety import (
 )
 
 
+def _or_default(value: Any, default: str) -> str:
+    """Convert a column value to a string, using default when it is None"""
+    return default if value is None else str(value)
+
+
 class DetailPage:
     """Application detail page"""
 
-    def __init__(self, page: ft.Page, session_factory: Callable[[], Session], on_back: Callable[[], None]):
+    def __init__(self, page: ft.Page, session_factory: Callable[[], Session], on_back: Callable[[], None],
+                 search_engine: Optional[SearchEngine] = None):
         self.page: ft.Page = page
         self.session_factory: Callable[[], Session] = session_factory        # Initialize detail view component
         self.on_back: Callable[[], None] = on_back
         self.detail_view: DetailView = DetailView(self.page, self.on_back)
-        # Initialize search engine for computing CV fields
         self.current_detail_id: Optional[int] = None
-        self.search_engine: SearchEngine = SearchEngine()
+        # Search engine for computing CV fields, shared with the app when
+        # given and otherwise created on first use
+        self._search_engine: Optional[SearchEngine] = search_engine
+        # Not-found and error views are built once; only the error text changes
+        self._not_found_view: Optional[ft.Control] = None
+        self._error_view: Optional[ft.Control] = None
+        self._error_text: Optional[ft.Text] = None
+        # Incremented per build so a slow load can't replace a newer one
+        self._build_request_id = 0
+
+    @property
+    def search_engine(self) -> SearchEngine:
+        """Search engine used to compute CV fields"""
+        if self._search_engine is None:
+            self._search_engine = SearchEngine()
+        return self._search_engine
 
     def build(self, detail_id: int) -> ft.Control:
-        """Build the detail page for a specific application"""
+        """Build the detail page for a specific application, loading it in a separate thread"""
         self.current_detail_id = detail_id
+        self._build_request_id += 1
+        request_id = self._build_request_id
+        container = ft.Container(
+            content=ft.ProgressRing(),
+            alignment=ft.alignment.center,
+            expand=True
+        )
 
+        def load():
+            content = self._build_content(detail_id)
+            if request_id != self._build_request_id:
+                return
+            container.content = content
+            # The page may not be shown yet if the load was very quick
+            if container.page:
+                container.update()
+
+        threading.Thread(target=load, daemon=True).start()
+        return container
+
+    def _build_content(self, detail_id: int) -> ft.Control:
+        """Query the application and build its detail view"""
         try:
-            db: Session = self.session_factory()
-            try:
-                applicant_detail: Optional[ApplicantDetail] = db.query(ApplicantDetail).filter(
+            with self.session_factory() as db:
+                # Load the profile in the same query instead of lazily on first access
+                applicant_detail: Optional[ApplicantDetail] = db.query(ApplicantDetail).options(
+                    joinedload(ApplicantDetail.profile)).filter(
                     ApplicantDetail.detail_id == detail_id).first()
 
                 if applicant_detail and applicant_detail.profile:
@@ -43,10 +86,7 @@ class DetailPage:
                     # Get decrypted profile data for display
                     display_profile = profile.get_display_data()
 
-                    full_name: str = f"{display_profile.first_name or ''} {display_profile.last_name or ''}".strip(
-                    )
-                    if not full_name:
-                        full_name = f"Applicant #{display_profile.applicant_id}"
+                    full_name: str = profile.full_name or f"Applicant #{profile.applicant_id}"
 
                     # Parse JSON fields safely using the decrypted data                    # Create combined data dict using type-safe functions
                     applicant_data: Dict[str, Any] = {
@@ -54,13 +94,16 @@ class DetailPage:
                         'applicant_id': applicant_detail.applicant_id,
                         'name': full_name,
                         'email': 'Not provided',  # Email removed from new schema
-                        'phone': safe_get_str({'phone': display_profile.phone_number}, 'phone', 'Not provided'),                        'cv_path': safe_get_str({'path': applicant_detail.cv_path}, 'path', ''),
-                        'application_role': safe_get_str({'role': applicant_detail.application_role}, 'role', 'Not specified'),                        'address': safe_get_str({'address': display_profile.address}, 'address', 'Not provided'),
+                        'phone': _or_default(display_profile.phone_number, 'Not provided'),
+                        'cv_path': _or_default(applicant_detail.cv_path, ''),
+                        'application_role': _or_default(applicant_detail.application_role, 'Not specified'),
+                        'address': _or_default(display_profile.address, 'Not provided'),
                         'date_of_birth': format_datetime_safe(display_profile.date_of_birth, "%Y-%m-%d", 'Not provided')}
 
-                    # Compute CV fields on demand using search engine
+                    # Compute CV fields on demand using search engine, reusing
+                    # the detail loaded above instead of querying it again
                     detail_with_computed = self.search_engine.get_applicant_details(
-                        detail_id)
+                        detail_id, applicant_detail)
                     if detail_with_computed:
                         computed_fields = {
                             'extracted_text': safe_get_str(detail_with_computed, 'extracted_text', ''),
@@ -94,46 +137,40 @@ class DetailPage:
                         return self._build_error(f"Data validation error: {str(e)}")
                 else:
                     return self._build_not_found()
-            finally:
-                db.close()
         except Exception as e:
             print(f"Error in DetailPage.build: {e}")
             return self._build_error(str(e))
 
     def _build_not_found(self) -> ft.Control:
         """Build not found view"""
-        return ft.Column([
-            ft.Container(
-                content=ft.Column([
-                    ft.Icon(ft.Icons.DESCRIPTION_OUTLINED, size=60,
-                            color=ft.Colors.GREY_400),
-                    ft.Text("Application Not Found", size=24,
-                            weight=ft.FontWeight.BOLD),
-                    ft.Text("The requested application could not be found.",
-                            size=16, color=ft.Colors.GREY_600),
-                    ft.Container(height=20),
-                    ft.ElevatedButton(
-                        "Go Back",
-                        on_click=lambda e: self.on_back(),
-                        bgcolor=ft.Colors.BLUE_600,
-                        color=ft.Colors.WHITE
-                    )
-                ], horizontal_alignment=ft.CrossAxisAlignment.CENTER, spacing=10),
-                padding=50,
-                alignment=ft.alignment.center
-            )
-        ], expand=True)
+        if self._not_found_view is None:
+            self._not_found_view = self._build_message_view(
+                ft.Icon(ft.Icons.DESCRIPTION_OUTLINED, size=60,
+                        color=ft.Colors.GREY_400),
+                "Application Not Found",
+                ft.Text("The requested application could not be found.",
+                        size=16, color=ft.Colors.GREY_600))
+        return self._not_found_view
 
     def _build_error(self, error_message: str) -> ft.Control:
         """Build error view"""
+        if self._error_view is None:
+            self._error_text = ft.Text("", size=16, color=ft.Colors.RED_600)
+            self._error_view = self._build_message_view(
+                ft.Icon(ft.Icons.ERROR, size=60, color=ft.Colors.RED_400),
+                "Error Loading Applicant",
+                self._error_text)
+        self._error_text.value = f"Error: {error_message}"
+        return self._error_view
+
+    def _build_message_view(self, icon: ft.Icon, title: str, message: ft.Text) -> ft.Control:
+        """Build a centered message with a button back to the previous page"""
         return ft.Column([
             ft.Container(
                 content=ft.Column([
-                    ft.Icon(ft.Icons.ERROR, size=60, color=ft.Colors.RED_400),
-                    ft.Text("Error Loading Applicant", size=24,
-                            weight=ft.FontWeight.BOLD),
-                    ft.Text(f"Error: {error_message}",
-                            size=16, color=ft.Colors.RED_600),
+                    icon,
+                    ft.Text(title, size=24, weight=ft.FontWeight.BOLD),
+                    message,
                     ft.Container(height=20),
                     ft.ElevatedButton(
                         "Go Back",
@@ -4,12 +4,10 @@ from dotenv import load_dotenv
 load_dotenv()
 
 
+import logging
 import os
 from pathlib import Path
 import sys
-from gui.main_window import MainWindow
-from core.search_engine import SearchEngine
-from core.cv_processor import CVProcessor
 from database.models.init_database import get_schema_info
 from database import init_db, SessionLocal, ApplicantProfile
 import flet as ft
@@ -22,6 +20,15 @@ sys.path.insert(0, str(src_dir))
 
 # Now import modules that depend on environment variables
 
+# Startup messages are logged; set LOG_LEVEL=INFO to see progress or
+# LOG_LEVEL=DEBUG to also see the database settings and schema; unknown
+# levels fall back to WARNING
+log_level = getattr(logging, os.getenv("LOG_LEVEL", "WARNING").upper(), None)
+if not isinstance(log_level, int):
+    log_level = logging.WARNING
+logging.basicConfig(level=log_level)
+logger = logging.getLogger(__name__)
+
 
 def main(page: ft.Page):
     # Page configuration
@@ -31,19 +38,32 @@ def main(page: ft.Page):
     page.window_resizable = True
     page.theme_mode = ft.ThemeMode.LIGHT
 
-    # Print loaded environment variables for debugging
-    print(f"DB_HOST: {os.getenv('DB_HOST', 'localhost')}")
-    print(f"DB_PORT: {os.getenv('DB_PORT', '3306')}")
-    print(f"DB_NAME: {os.getenv('DB_NAME', 'cv_chisli')}")
-    print(f"DB_USER: {os.getenv('DB_USER', 'root')}")
-    print(
-        f"DB_PASSWORD: {'*' * len(os.getenv('DB_PASSWORD', '')) if os.getenv('DB_PASSWORD') else 'Not set'}")
-    print(f"database URL: {DATABASE_URL}")
+    # Show progress straight away; the window would otherwise stay blank
+    # until initialization is done
+    loading_panel = ft.Container(
+        content=ft.Column([
+            ft.ProgressRing(),
+            ft.Text("Starting CV Matching System...",
+                    size=16, color=ft.Colors.GREY_600),
+        ], horizontal_alignment=ft.CrossAxisAlignment.CENTER,
+            alignment=ft.MainAxisAlignment.CENTER),
+        alignment=ft.alignment.center,
+        expand=True
+    )
+    page.add(loading_panel)
+
+    # Log loaded environment variables for debugging
+    logger.debug("DB_HOST: %s", os.getenv('DB_HOST', 'localhost'))
+    logger.debug("DB_PORT: %s", os.getenv('DB_PORT', '3306'))
+    logger.debug("DB_NAME: %s", os.getenv('DB_NAME', 'cv_chisli'))
+    logger.debug("DB_USER: %s", os.getenv('DB_USER', 'root'))
+    logger.debug("DB_PASSWORD: %s", '*' * len(os.getenv('DB_PASSWORD', '')) if os.getenv('DB_PASSWORD') else 'Not set')
+    logger.debug("database URL: %s", DATABASE_URL)
 
     try:        # Initialize database with automatic migration
-        print("Initializing database with automatic migration...")
+        logger.info("Initializing database with automatic migration...")
         if not init_db():
-            print("Database initialization failed!")
+            logger.error("Database initialization failed!")
             raise Exception("Failed to initialize database")
 
         # Check for existing data
@@ -51,35 +71,42 @@ def main(page: ft.Page):
         check_existing_data()
 
         # Show schema info for debugging
-        print("\nCurrent database schema:")
-        schema_info = get_schema_info()
-        for table, info in schema_info.items():
-            print(f"  {table}: {info['column_count']} columns")
-            for col_name, col_type in info['columns'].items():
-                # Test database connection
-                print(f"    - {col_name}: {col_type}")
-        print("\nTesting database connection...")
+        # The schema is only queried when it will be logged
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Current database schema:")
+            schema_info = get_schema_info()
+            for table, info in schema_info.items():
+                logger.debug("  %s: %s columns", table, info['column_count'])
+                for col_name, col_type in info['columns'].items():
+                    logger.debug("    - %s: %s", col_name, col_type)
+
+        # Test database connection
+        logger.info("Testing database connection...")
         db = SessionLocal()
         try:            # Test query
             result = db.query(ApplicantProfile).first()
-            print("Database connection successful")
+            logger.info("Database connection successful")
             if result:
-                print(
-                    f"   Found existing applicant with ID: {result.applicant_id}")
+                logger.info(
+                    "   Found existing applicant with ID: %s", result.applicant_id)
             else:
-                print("   No applicants in database yet")
+                logger.info("   No applicants in database yet")
         except Exception as e:
-            print(f"Database test failed: {e}")
+            logger.error("Database test failed: %s", e)
             raise Exception(f"Database connection test failed: {e}")
         finally:
             db.close()
 
-        print("Initializing CV processor...")
-        cv_processor = CVProcessor()
+        # Deferred until now: these pull in the UI pages and the PDF and
+        # data libraries, which would otherwise delay the loading panel
+        from gui.main_window import MainWindow
+        from core.search_engine import SearchEngine
 
-        print("Initializing search engine...")
+        # The CV processor is created on first use (upload, search or
+        # detail view) through core.cv_processor.get_cv_processor()
+        logger.info("Initializing search engine...")
         search_engine = SearchEngine()
-        print("Search engine initialized successfully")
+        logger.info("Search engine initialized successfully")
 
         # try:
         #     print("Reading CVs")
@@ -88,17 +115,18 @@ def main(page: ft.Page):
         #     print(f"Error reading CVs: {e}")
         #     raise
 
-        print("CV processor initialized successfully")
-
-        print("Creating main window...")
+        logger.info("Creating main window...")
         # Create main window - pass SessionLocal instead of db_manager
         main_window = MainWindow(
-            page, SessionLocal, cv_processor, search_engine)        # Add main window to page
+            page, SessionLocal, search_engine)        # Add main window to page
+        page.controls.remove(loading_panel)
         page.add(main_window.build())
-        print("Application initialized successfully!")
+        logger.info("Application initialized successfully!")
 
     except Exception as e:
-        print(f"Error initializing application: {e}")
+        logger.error("Error initializing application: %s", e)
+        if loading_panel in page.controls:
+            page.controls.remove(loading_panel)
         # Show error page
         error_content = ft.Column([
             ft.Container(
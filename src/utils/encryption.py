@@ -1,4 +1,4 @@
-import random
+import secrets
 import string
 import base64
 
@@ -9,53 +9,60 @@ class CustomEncryption:
     def __init__(self, key: str = "TUBES3_ENCRYPTION_KEY"):
         self.key = key
         self.key_length = len(key)
+        # The Caesar shift and the Vigenère shift of a key position both
+        # move letters through the alphabet, so each key position gets one
+        # prebuilt table mapping every letter to its shifted letter
+        caesar_shift = sum(ord(c) for c in key) % 26
+        self._encrypt_tables = []
+        self._decrypt_tables = []
+        for c in key:
+            shift = (caesar_shift + ord(c.upper()) - ord('A')) % 26
+            shifted = (string.ascii_lowercase[shift:] + string.ascii_lowercase[:shift] +
+                       string.ascii_uppercase[shift:] + string.ascii_uppercase[:shift])
+            self._encrypt_tables.append(str.maketrans(string.ascii_letters, shifted))
+            self._decrypt_tables.append(str.maketrans(shifted, string.ascii_letters))
+        self._xor_key = [ord(c) for c in key]
 
     def _generate_salt(self, length: int = 8) -> str:
         """Generate random salt for encryption"""
-        return ''.join(random.choices(string.ascii_letters + string.digits, k=length))
-
-    def _caesar_cipher(self, text: str, shift: int) -> str:
-        """Apply Caesar cipher with given shift"""
-        result = ""
-        for char in text:
-            if char.isalpha():
-                ascii_offset = 65 if char.isupper() else 97
-                result += chr((ord(char) - ascii_offset + shift) %
-                              26 + ascii_offset)
-            else:
-                result += char
-        return result
-
-    def _vigenere_cipher(self, text: str, key: str) -> str:
-        """Apply Vigenère cipher"""
-        result = ""
+        return secrets.token_urlsafe(length)[:length]
+
+    def _encrypt_layers(self, text: str) -> str:
+        """Apply the Caesar, Vigenère and XOR ciphers in a single pass"""
+        tables = self._encrypt_tables
+        xor_key = self._xor_key
+        key_length = self.key_length
+        result = []
         key_index = 0
-
-        for char in text:
-            if char.isalpha():
-                key_char = key[key_index % len(key)]
-                shift = ord(key_char.upper()) - ord('A')
-
-                if char.isupper():
-                    result += chr((ord(char) - ord('A') + shift) %
-                                  26 + ord('A'))
-                else:
-                    result += chr((ord(char) - ord('a') + shift) %
-                                  26 + ord('a'))
-
+        for i, char in enumerate(text):
+            code = ord(char)
+            # Layers 1 and 2: Caesar and Vigenère shift letters only, the
+            # Vigenère key advancing once per letter
+            shifted = tables[key_index % key_length].get(code)
+            if shifted is not None:
+                code = shifted
                 key_index += 1
-            else:
-                result += char
-
-        return result
-
-    def _xor_cipher(self, text: str, key: str) -> str:
-        """Apply XOR cipher"""
-        result = ""
+            # Layer 3: XOR every character with the key
+            result.append(chr(code ^ xor_key[i % key_length]))
+        return "".join(result)
+
+    def _decrypt_layers(self, text: str) -> str:
+        """Reverse the XOR, Vigenère and Caesar ciphers in a single pass"""
+        tables = self._decrypt_tables
+        xor_key = self._xor_key
+        key_length = self.key_length
+        result = []
+        key_index = 0
         for i, char in enumerate(text):
-            key_char = key[i % len(key)]
-            result += chr(ord(char) ^ ord(key_char))
-        return result
+            # Reverse layer 3: XOR cipher
+            code = ord(char) ^ xor_key[i % key_length]
+            # Reverse layers 2 and 1: Vigenère and Caesar ciphers
+            shifted = tables[key_index % key_length].get(code)
+            if shifted is not None:
+                code = shifted
+                key_index += 1
+            result.append(chr(code))
+        return "".join(result)
 
     def encrypt(self, plaintext: str) -> str:
         """Encrypt text using layered encryption"""
@@ -66,15 +73,8 @@ class CustomEncryption:
         salt = self._generate_salt()
         salted_text = salt + plaintext
 
-        # Layer 1: Caesar cipher with dynamic shift
-        shift = sum(ord(c) for c in self.key) % 26
-        encrypted = self._caesar_cipher(salted_text, shift)
-
-        # Layer 2: Vigenère cipher
-        encrypted = self._vigenere_cipher(encrypted, self.key)
-
-        # Layer 3: XOR cipher
-        encrypted = self._xor_cipher(encrypted, self.key)
+        # Caesar cipher with dynamic shift, Vigenère cipher and XOR cipher
+        encrypted = self._encrypt_layers(salted_text)
 
         # Encode to make it database-safe using standard Base64
         # Convert string to bytes before encoding
@@ -95,15 +95,8 @@ class CustomEncryption:
             # Decode the bytes back to a string
             encrypted = encrypted_bytes.decode('utf-8')
 
-            # Reverse Layer 3: XOR cipher
-            decrypted = self._xor_cipher(encrypted, self.key)
-
-            # Reverse Layer 2: Vigenère cipher
-            decrypted = self._vigenere_cipher_decrypt(decrypted, self.key)
-
-            # Reverse Layer 1: Caesar cipher
-            shift = sum(ord(c) for c in self.key) % 26
-            decrypted = self._caesar_cipher(decrypted, -shift)
+            # Reverse the XOR, Vigenère and Caesar ciphers
+            decrypted = self._decrypt_layers(encrypted)
 
             # Remove salt (first 8 characters)
             return decrypted[8:]
@@ -113,29 +106,6 @@ class CustomEncryption:
             # This handles cases where unencrypted data might be passed
             return ciphertext
 
-    def _vigenere_cipher_decrypt(self, text: str, key: str) -> str:
-        """Decrypt Vigenère cipher"""
-        result = ""
-        key_index = 0
-
-        for char in text:
-            if char.isalpha():
-                key_char = key[key_index % len(key)]
-                shift = ord(key_char.upper()) - ord('A')
-
-                if char.isupper():
-                    result += chr((ord(char) - ord('A') - shift) %
-                                  26 + ord('A'))
-                else:
-                    result += chr((ord(char) - ord('a') - shift) %
-                                  26 + ord('a'))
-
-                key_index += 1
-            else:
-                result += char
-
-        return result
-
 
 # Global encryption instance
 encryption = CustomEncryption()
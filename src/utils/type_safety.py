@@ -10,8 +10,24 @@ from datetime import datetime, date
 
 T = TypeVar('T')
 
-
-@dataclass
+# ApplicantDataSchema fields by type, with the defaults used when missing
+_APPLICANT_INT_FIELDS = (('detail_id', 0), ('applicant_id', 0))
+_APPLICANT_STR_FIELDS = (
+    ('name', 'Unknown'),
+    ('email', 'Not provided'),
+    ('phone', 'Not provided'),
+    ('cv_path', ''),
+    ('extracted_text', ''),
+    ('summary', ''),
+    ('application_role', 'Not specified'),
+    ('address', 'Not provided'),
+    ('date_of_birth', 'Not provided'),
+)
+_APPLICANT_LIST_FIELDS = (
+    'skills', 'work_experience', 'education', 'highlights', 'accomplishments')
+
+
+@dataclass(slots=True)
 class ApplicantDataSchema:
     """Type-safe schema for applicant data passed between components"""
     detail_id: int
@@ -34,24 +50,13 @@ class ApplicantDataSchema:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'ApplicantDataSchema':
         """Create ApplicantDataSchema from dictionary with validation"""
-        return cls(
-            detail_id=safe_get_int(data, 'detail_id', 0),
-            applicant_id=safe_get_int(data, 'applicant_id', 0),
-            name=safe_get_str(data, 'name', 'Unknown'),
-            email=safe_get_str(data, 'email', 'Not provided'),
-            phone=safe_get_str(data, 'phone', 'Not provided'),
-            cv_path=safe_get_str(data, 'cv_path', ''),
-            extracted_text=safe_get_str(data, 'extracted_text', ''),
-            summary=safe_get_str(data, 'summary', ''),
-            skills=safe_get_list(data, 'skills', []),
-            work_experience=safe_get_list(data, 'work_experience', []),
-            education=safe_get_list(data, 'education', []),            highlights=safe_get_list(data, 'highlights', []),
-            accomplishments=safe_get_list(data, 'accomplishments', []),
-            application_role=safe_get_str(
-                data, 'application_role', 'Not specified'),
-            address=safe_get_str(data, 'address', 'Not provided'),
-            date_of_birth=safe_get_str(data, 'date_of_birth', 'Not provided')
-        )
+        fields: Dict[str, Any] = {
+            key: safe_get_int(data, key, default) for key, default in _APPLICANT_INT_FIELDS}
+        for key, default in _APPLICANT_STR_FIELDS:
+            fields[key] = safe_get_str(data, key, default)
+        for key in _APPLICANT_LIST_FIELDS:
+            fields[key] = safe_get_list(data, key, [])
+        return cls(**fields)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for backward compatibility"""
@@ -74,7 +79,7 @@ class ApplicantDataSchema:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class SearchResultSchema:
     """Type-safe schema for search results"""
     results: List[Dict[str, Any]]
@@ -97,6 +102,8 @@ class SearchResultSchema:
         )
 
 
+# Type guards for callers; the helpers in this module call isinstance
+# directly to avoid the extra function call
 def is_dict(obj: Any) -> TypeGuard[Dict[str, Any]]:
     """Type guard to check if object is a dictionary"""
     return isinstance(obj, dict)
@@ -124,10 +131,12 @@ def is_float(obj: Any) -> TypeGuard[float]:
 
 def safe_get_str(data: Any, key: str, default: str = '') -> str:
     """Safely get string value from dictionary-like object"""
-    if not is_dict(data):
+    # Anything without .get is not dictionary-like; asking forgiveness is
+    # cheaper than an isinstance check on every call
+    try:
+        value = data.get(key, default)
+    except AttributeError:
         return default
-
-    value = data.get(key, default)
     if value is None:
         return default
 
@@ -136,10 +145,10 @@ def safe_get_str(data: Any, key: str, default: str = '') -> str:
 
 def safe_get_int(data: Any, key: str, default: int = 0) -> int:
     """Safely get integer value from dictionary-like object"""
-    if not is_dict(data):
+    try:
+        value = data.get(key, default)
+    except AttributeError:
         return default
-
-    value = data.get(key, default)
     if value is None:
         return default
 
@@ -151,10 +160,10 @@ def safe_get_int(data: Any, key: str, default: int = 0) -> int:
 
 def safe_get_float(data: Any, key: str, default: float = 0.0) -> float:
     """Safely get float value from dictionary-like object"""
-    if not is_dict(data):
+    try:
+        value = data.get(key, default)
+    except AttributeError:
         return default
-
-    value = data.get(key, default)
     if value is None:
         return default
 
@@ -169,21 +178,21 @@ def safe_get_list(data: Any, key: str, default: Optional[List[Any]] = None) -> L
     if default is None:
         default = []
 
-    if not is_dict(data):
+    try:
+        value = data.get(key, default)
+    except AttributeError:
         return default
-
-    value = data.get(key, default)
     if value is None:
         return default
 
-    if is_list(value):
+    if isinstance(value, list):
         return value
 
-    # Try to parse JSON if it's a string
-    if is_string(value):
+    # Try to parse JSON if it's a string that can hold a JSON array
+    if isinstance(value, str) and value.lstrip().startswith('['):
         try:
             parsed = json.loads(value)
-            if is_list(parsed):
+            if isinstance(parsed, list):
                 return parsed
         except (json.JSONDecodeError, TypeError):
             pass
@@ -196,21 +205,21 @@ def safe_get_dict(data: Any, key: str, default: Optional[Dict[str, Any]] = None)
     if default is None:
         default = {}
 
-    if not is_dict(data):
+    try:
+        value = data.get(key, default)
+    except AttributeError:
         return default
-
-    value = data.get(key, default)
     if value is None:
         return default
 
-    if is_dict(value):
+    if isinstance(value, dict):
         return value
 
-    # Try to parse JSON if it's a string
-    if is_string(value):
+    # Try to parse JSON if it's a string that can hold a JSON object
+    if isinstance(value, str) and value.lstrip().startswith('{'):
         try:
             parsed = json.loads(value)
-            if is_dict(parsed):
+            if isinstance(parsed, dict):
                 return parsed
         except (json.JSONDecodeError, TypeError):
             pass
@@ -220,7 +229,7 @@ def safe_get_dict(data: Any, key: str, default: Optional[Dict[str, Any]] = None)
 
 def validate_applicant_data(data: Any) -> ApplicantDataSchema:
     """Validate and convert applicant data to type-safe schema"""
-    if not is_dict(data):
+    if not isinstance(data, dict):
         raise TypeError(f"Expected dictionary, got {type(data)}")
 
     return ApplicantDataSchema.from_dict(data)
@@ -228,7 +237,7 @@ def validate_applicant_data(data: Any) -> ApplicantDataSchema:
 
 def validate_search_results(data: Any) -> SearchResultSchema:
     """Validate and convert search results to type-safe schema"""
-    if not is_dict(data):
+    if not isinstance(data, dict):
         raise TypeError(f"Expected dictionary, got {type(data)}")
 
     return SearchResultSchema.from_dict(data)
@@ -247,7 +256,7 @@ def ensure_string(value: Any, default: str = '') -> str:
     """Ensure value is a string, convert if possible, return default if not"""
     if value is None:
         return default
-    if is_string(value):
+    if isinstance(value, str):
         return value
     try:
         return str(value)
@@ -262,7 +271,7 @@ def ensure_list(value: Any, default: Optional[List[Any]] = None) -> List[Any]:
 
     if value is None:
         return default
-    if is_list(value):
+    if isinstance(value, list):
         return value
 
     # Try to convert single item to list
@@ -289,7 +298,7 @@ def format_datetime_safe(dt: Any, format_str: str = "%Y-%m-%d %H:%M:%S", default
         except (ValueError, TypeError):
             return default
 
-    if is_string(dt):
+    if isinstance(dt, str):
         return dt
 
     return default
@@ -297,7 +306,7 @@ def format_datetime_safe(dt: Any, format_str: str = "%Y-%m-%d %H:%M:%S", default
 
 def parse_json_safe(json_str: Any, default: Any = None) -> Any:
     """Safely parse JSON string"""
-    if not is_string(json_str):
+    if not isinstance(json_str, str):
         return default
 
     try:
@@ -324,7 +333,7 @@ def assert_type(obj: Any, expected_type: type, message: str = "") -> None:
 
 def assert_dict_has_keys(data: Dict[str, Any], required_keys: List[str]) -> None:
     """Assert that dictionary has all required keys"""
-    if not is_dict(data):
+    if not isinstance(data, dict):
         raise TypeSafetyError(
             f"Expected dictionary, got {type(data).__name__}")
 